@@ -6,8 +6,22 @@ def pytest_configure():
     add_future_flags()
 
 
+def pytest_sessionstart(session):
+    bootstrap_benchmarks(session.config)
+
+
 def add_future_flags():  # pragma: no cover
     if sys.version_info >= (3, 10):
         return
 
     builtins.EncodingWarning = type('EncodingWarning', (Warning,), {})
+
+
+def bootstrap_benchmarks(config):
+    """
+    With no saved run to compare against, let the first run of the
+    benchmarks record the baseline instead of failing the comparison.
+    """
+    benchmarks = config.pluginmanager.get_plugin('pytest-benchmark')
+    if benchmarks and not benchmarks.compared_mapping:
+        benchmarks.compare_fail = None
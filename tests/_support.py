@@ -1,4 +1,5 @@
 import importlib
+import pathlib
 import unittest
 
 
@@ -7,3 +8,24 @@ def import_or_skip(name):
         return importlib.import_module(name)
     except ImportError:  # pragma: no cover
         raise unittest.SkipTest(f'Unable to import {name}')
+
+
+def alpharep_bytes():
+    """
+    Return the contents of the alpharep fixture as a finished archive.
+    """
+    from .test_path import build_alpharep_fixture
+
+    alpharep = build_alpharep_fixture()
+    buffer = alpharep.fp
+    alpharep.close()
+    return buffer.getvalue()
+
+
+def write_alpharep(directory, name='alpharep.zip'):
+    """
+    Write the alpharep fixture to name in directory, returning its path.
+    """
+    path = pathlib.Path(directory) / name
+    path.write_bytes(alpharep_bytes())
+    return path
@@ -0,0 +1,82 @@
+import concurrent.futures
+import threading
+import unittest
+from unittest import mock
+
+import zipp
+from zipp.aio import AsyncPath
+
+from ._support import write_alpharep
+from .compat.py39.os_helper import temp_dir  # type: ignore[import-not-found]
+from .test_path import build_alpharep_fixture
+
+
+async def collect(aiterable):
+    return [item async for item in aiterable]
+
+
+class TestAsyncPath(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.root = AsyncPath(build_alpharep_fixture())
+
+    async def test_iterdir(self):
+        names = [path.name for path in await collect(self.root.iterdir())]
+        assert names == ['a.txt', 'n.txt', 'b', 'g', 'j']
+        (e,) = await collect((self.root / 'b' / 'd').iterdir())
+        assert isinstance(e, AsyncPath)
+        assert e.is_file()
+
+    async def test_glob(self):
+        matches = await collect(self.root.glob('b/*.txt'))
+        assert [path.at for path in matches] == ['b/c.txt', 'b/f.txt']
+        matches = await collect(self.root.rglob('i.txt'))
+        assert matches == [self.root / 'g/h/i.txt']
+        matches = await collect(self.root.glob('b/*', kind='dir'))
+        assert [path.at for path in matches] == ['b/d/']
+        matches = await collect(self.root.rglob('*.txt', max_depth=2))
+        assert [path.at for path in matches] == ['b/c.txt', 'b/f.txt']
+
+    async def test_read(self):
+        c = self.root / 'b' / 'c.txt'
+        assert await c.read_bytes() == b'content of c'
+        assert await c.read_text(encoding='utf-8') == 'content of c'
+        assert b''.join(await collect(c.iter_chunks(5))) == b'content of c'
+        assert await collect(c.iter_chunks(5)) == [b'conte', b'nt of', b' c']
+
+    async def test_shares_root(self):
+        """
+        An AsyncPath shares the root of the Path it wraps.
+        """
+        path = zipp.Path(build_alpharep_fixture())
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            root = AsyncPath(path, executor=executor)
+            child = root / 'a.txt'
+            assert child.root is path.root
+            assert child.executor is executor
+            assert await child.read_text(encoding='utf-8') == 'content of a'
+
+    async def test_load(self):
+        """
+        AsyncPath.load parses the archive and builds its indexes
+        off the event loop.
+        """
+        with temp_dir() as tmpdir:
+            archive = write_alpharep(tmpdir)
+            threads = set()
+            init = zipp.FastLookup.__init__
+
+            def record(self, *args, **kwargs):
+                threads.add(threading.current_thread())
+                init(self, *args, **kwargs)
+
+            with mock.patch.object(zipp.FastLookup, '__init__', record):
+                root = await AsyncPath.load(archive, 'b/')
+            assert threads and threading.current_thread() not in threads
+            assert {'_name_set_prop', '_tree_prop'} <= set(vars(root.root))
+            assert root.at == 'b/'
+            assert [path.name for path in await collect(root.iterdir())] == [
+                'c.txt',
+                'f.txt',
+                'd',
+            ]
+            root.root.close()
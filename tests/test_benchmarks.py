@@ -0,0 +1,174 @@
+"""
+Benchmarks of Path operations across archive shapes and sizes.
+
+Requires pytest-benchmark. Sizes default to 1000 entries; set
+``ZIPP_BENCHMARK_SIZES`` (comma-separated) for more, as the
+``benchmark`` tox environment does, which also saves each run and
+fails on regression against the previous one.
+"""
+
+import itertools
+import os
+import pickle
+import tracemalloc
+import zipfile
+
+from more_itertools import consume
+
+import zipp
+
+from ._support import import_or_skip
+from .test_import import import_times
+
+import_or_skip('pytest_benchmark')
+pytest = import_or_skip('pytest')
+
+
+sizes = [
+    int(size) for size in os.environ.get('ZIPP_BENCHMARK_SIZES', '1000').split(',')
+]
+
+
+def wide(size):
+    """
+    All entries in one directory.
+    """
+    return (f'wide/{n}.txt' for n in range(size))
+
+
+def deep(size):
+    """
+    Entries spread over directories nested up to 32 deep.
+    """
+    return (f'{"d/" * (n % 32)}{n}.txt' for n in range(size))
+
+
+def wheel(size):
+    """
+    A package of modules in subpackages, with its metadata.
+    """
+    metadata = ['METADATA', 'WHEEL', 'RECORD']
+    modules = (f'pkg/sub{n % 100}/mod{n}.py' for n in range(size - len(metadata)))
+    return itertools.chain(
+        (f'pkg-1.0.dist-info/{name}' for name in metadata),
+        modules,
+    )
+
+
+def jar(size):
+    """
+    Classes in a deep package hierarchy, with a manifest.
+    """
+    classes = (f'com/example/p{n % 50}/q{n % 20}/C{n}.class' for n in range(size - 1))
+    return itertools.chain(['META-INF/MANIFEST.MF'], classes)
+
+
+shapes = [wide, deep, wheel, jar]
+
+
+@pytest.fixture(
+    scope='module',
+    params=itertools.product(shapes, sizes),
+    ids=lambda param: f'{param[0].__name__}-{param[1]}',
+)
+def archive(request, tmp_path_factory):
+    shape, size = request.param
+    path = tmp_path_factory.mktemp('archives') / f'{shape.__name__}-{size}.zip'
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for name in shape(size):
+            zf.writestr(name, b'content of ' + name.encode())
+    return path
+
+
+@pytest.fixture
+def root(archive):
+    path = zipp.Path(archive)
+    yield path
+    path.root.close()
+
+
+@pytest.fixture
+def member(root):
+    """
+    The last entry in the archive.
+    """
+    return root.root.filelist[-1].filename
+
+
+def test_construct(benchmark, archive):
+    def construct():
+        path = zipp.Path(archive)
+        path.root.namelist()
+        path.root.close()
+
+    tracemalloc.start()
+    construct()
+    benchmark.extra_info['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    benchmark(construct)
+
+
+def test_namelist(benchmark, root):
+    benchmark(root.root.namelist)
+
+
+def test_exists(benchmark, root, member):
+    path = root / member
+    benchmark(path.exists)
+
+
+def test_iterdir(benchmark, root):
+    benchmark(lambda: consume(root.iterdir()))
+
+
+def test_walk(benchmark, root):
+    def walk(path):
+        for child in path.iterdir():
+            if child.is_dir():
+                walk(child)
+
+    benchmark(walk, root)
+
+
+def test_path_walk(benchmark, root):
+    benchmark(lambda: consume(root.walk()))
+
+
+def test_glob(benchmark, root, member):
+    parent = member.rpartition('/')[0]
+    benchmark(lambda: consume(root.glob(f'{parent}/*')))
+
+
+def test_rglob(benchmark, root):
+    benchmark(lambda: consume(root.rglob('*1.*')))
+
+
+def test_glob_many(benchmark, root):
+    patterns = ['**/*1.*', '**/*2.*', '*/*']
+    benchmark(lambda: consume(root.glob_many(patterns)))
+
+
+def test_joinpath(benchmark, root, member):
+    benchmark(root.joinpath, *member.split('/'))
+
+
+def test_read_bytes(benchmark, root, member):
+    benchmark(root.joinpath(member).read_bytes)
+
+
+def test_read_many(benchmark, root):
+    benchmark(lambda: consume(root.read_many('**/*1.*')))
+
+
+def test_pickle(benchmark, root, member):
+    path = root / member
+    benchmark(lambda: pickle.loads(pickle.dumps(path)))
+
+
+def test_import(benchmark):
+    """
+    Import zipp in a new interpreter, recording the cumulative
+    import time of zipp itself (in microseconds).
+    """
+    times = benchmark.pedantic(import_times, args=('import zipp',), rounds=10)
+    benchmark.extra_info['zipp_us'] = dict(times)['zipp']
@@ -0,0 +1,75 @@
+import io
+import unittest
+import zipfile
+
+import zipp
+from zipp.cache import ContentCache
+
+
+def deflated(**members):
+    data = io.BytesIO()
+    zf = zipfile.ZipFile(data, 'w', compression=zipfile.ZIP_DEFLATED)
+    for name, content in members.items():
+        zf.writestr(name, content)
+    return zf
+
+
+class TestContentCache(unittest.TestCase):
+    def test_eviction(self):
+        cache = ContentCache(maxsize=10, max_item=10)
+        cache.put('a', b'aaaa')
+        cache.put('b', b'bbbb')
+        assert cache.get('a') == b'aaaa'
+        cache.put('c', b'cccc')
+        assert cache.get('b') is None
+        assert cache.get('a') == b'aaaa'
+        assert cache.size == 8
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_large_items_not_cached(self):
+        cache = ContentCache(maxsize=16)
+        cache.put('a', b'aaa')
+        assert cache.get('a') is None
+        cache.put('b', b'bb')
+        assert cache.get('b') == b'bb'
+
+    def test_replace(self):
+        cache = ContentCache(maxsize=10, max_item=10)
+        cache.put('a', b'a')
+        cache.put('a', b'aa')
+        assert cache.size == 2
+        cache.clear()
+        assert cache.size == 0
+        assert cache.get('a') is None
+
+    def test_read(self):
+        zf = deflated(**{'a.txt': b'line 1\r\nline 2'})
+        zf.mode = 'r'
+        root = zipp.Path(zf)
+        cache = root.root.content_cache = ContentCache()
+        path = root / 'a.txt'
+        assert path.read_bytes() == b'line 1\r\nline 2'
+        assert path.read_bytes() == b'line 1\r\nline 2'
+        assert path.read_text(encoding='utf-8') == 'line 1\nline 2'
+        assert path.read_text(encoding='utf-8', newline='') == 'line 1\r\nline 2'
+        assert (cache.hits, cache.misses) == (3, 1)
+        with self.assertRaises(IsADirectoryError):
+            root.read_bytes()
+        with self.assertRaises(FileNotFoundError):
+            (root / 'missing.txt').read_text(encoding='utf-8')
+
+    def test_writable(self):
+        """
+        A member rewritten in a writable archive is read afresh.
+        """
+        zf = deflated(**{'a.txt': b'first'})
+        root = zipp.Path(zf)
+        cache = root.root.content_cache = ContentCache()
+        path = root / 'a.txt'
+        assert path.read_bytes() == b'first'
+        assert path.read_bytes() == b'first'
+        with self.assertWarns(UserWarning):  # duplicate name
+            zf.writestr('a.txt', b'second')
+        assert path.read_bytes() == b'second'
+        assert (cache.hits, cache.misses) == (1, 2)
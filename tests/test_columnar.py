@@ -0,0 +1,118 @@
+import io
+import pickle
+import tracemalloc
+import unittest
+import zipfile
+from unittest import mock
+
+import zipp
+from zipp.columnar import ColumnarLookup
+
+from ._support import alpharep_bytes
+
+
+class TestColumnar(unittest.TestCase):
+    def open(self, data):
+        root = ColumnarLookup(io.BytesIO(data))
+        self.addCleanup(root.close)
+        return root
+
+    def assert_matches(self, data):
+        root = self.open(data)
+        expected = zipfile.ZipFile(io.BytesIO(data))
+        self.addCleanup(expected.close)
+        assert type(root.infolist()) is list
+        assert len(root.infolist()) == len(expected.infolist())
+        for actual, info in zip(root.infolist(), expected.infolist()):
+            assert repr(actual) == repr(info)
+            for attr in ('date_time', 'extra', 'header_offset', 'CRC', 'external_attr'):
+                assert getattr(actual, attr) == getattr(info, attr)
+            assert getattr(actual, '_end_offset', None) == getattr(
+                info, '_end_offset', None
+            )
+            assert root.read(actual) == expected.read(info)
+
+    def test_matches_zipfile(self):
+        self.assert_matches(alpharep_bytes())
+
+    def test_concatenated(self):
+        self.assert_matches(b'prefix' + alpharep_bytes())
+
+    def test_zip64(self):
+        data = io.BytesIO()
+        with (
+            mock.patch.object(zipfile, 'ZIP64_LIMIT', 5),
+            zipfile.ZipFile(data, 'w') as zf,
+        ):
+            zf.writestr('small', b'x')
+            zf.writestr('large', b'y' * 10)
+        root = self.open(data.getvalue())
+        assert list(root._materialized) == [1]
+        self.assert_matches(data.getvalue())
+
+    def test_lazy(self):
+        root = self.open(alpharep_bytes())
+        path = zipp.Path(root)
+        assert [child.name for child in path.iterdir()] == [
+            'a.txt',
+            'n.txt',
+            'b',
+            'g',
+            'j',
+        ]
+        assert (path / 'b' / 'd' / 'e.txt').exists()
+        assert len(list(path.rglob('*.txt'))) == 4
+        assert 'b/c.txt' in root.NameToInfo
+        assert not root._materialized
+        assert (path / 'b' / 'c.txt').read_text(encoding='utf-8') == 'content of c'
+        assert (path / 'n.txt').is_symlink()
+        assert list(root._materialized) == [1]
+        assert root.getinfo('b/c.txt') is root.infolist()[1]
+
+    def test_stat(self):
+        data = alpharep_bytes()
+        root = zipp.Path(self.open(data))
+        expected = zipp.Path(zipp.FastLookup(io.BytesIO(data)))
+        self.addCleanup(expected.root.close)
+        for name in expected.root.namelist():
+            assert (root / name).stat() == (expected / name).stat()
+        assert not root.root._materialized
+        (root / 'a.txt').read_bytes()
+        assert (root / 'a.txt').stat() == (expected / 'a.txt').stat()
+
+    def test_missing(self):
+        root = self.open(alpharep_bytes())
+        with self.assertRaises(KeyError):
+            root.getinfo('missing')
+        with self.assertRaises(IndexError):
+            root.filelist[len(root.filelist)]
+
+    def test_read_only(self):
+        with self.assertRaises(ValueError):
+            ColumnarLookup(io.BytesIO(alpharep_bytes()), 'a')
+
+    def test_pickle(self):
+        root = zipp.Path(self.open(alpharep_bytes()), 'b/c.txt')
+        saved = pickle.loads(pickle.dumps(root))
+        assert saved.read_text(encoding='utf-8') == 'content of c'
+
+    def test_memory(self):
+        """
+        A columnar root retains substantially less than a ZipFile.
+        """
+        data = io.BytesIO()
+        with zipfile.ZipFile(data, 'w') as zf:
+            for n in range(5000):
+                zf.writestr(f'pkg/sub{n % 50}/mod{n}.py', b'')
+
+        def retained(factory):
+            tracemalloc.start()
+            try:
+                root = factory(io.BytesIO(data.getvalue()))
+                size = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+            root.close()
+            return size
+
+        assert retained(ColumnarLookup) < retained(zipfile.ZipFile) * 0.75
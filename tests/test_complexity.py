@@ -19,7 +19,7 @@ pytest = import_or_skip('pytest')
 class TestComplexity(unittest.TestCase):
     @pytest.mark.flaky
     def test_implied_dirs_performance(self):
-        best, others = big_o.big_o(
+        best, _ = big_o.big_o(
             compose(consume, zipfile._path.CompleteDirs._implied_dirs),
             lambda size: [
                 '/'.join(string.ascii_lowercase + str(n)) for n in range(size)
@@ -29,14 +29,20 @@ class TestComplexity(unittest.TestCase):
         )
         assert best <= big_o.complexities.Linear
 
-    def make_zip_path(self, depth=1, width=1):
+    def make_zip_path(self, depth=1, width=1, mode='w'):
         """
         Construct a Path with width files at every level of depth.
+
+        Pass mode='r' to get a read-only (FastLookup) root.
         """
-        zf = zipfile.ZipFile(io.BytesIO(), mode='w')
+        data = io.BytesIO()
+        zf = zipfile.ZipFile(data, mode='w')
         pairs = itertools.product(self.make_deep_paths(depth), self.make_names(width))
         for path, name in pairs:
             zf.writestr(f"{path}{name}.txt", b'')
+        if mode == 'r':
+            zf.close()
+            zf = zipfile.ZipFile(data)
         zf.filename = "big un.zip"
         return zipfile.Path(zf)
 
@@ -68,7 +74,7 @@ class TestComplexity(unittest.TestCase):
         return ''.join(('d/',) * depth)
 
     def test_baseline_regex_complexity(self):
-        best, others = big_o.big_o(
+        best, _ = big_o.big_o(
             lambda path: re.fullmatch(r'[^/]*\\.txt', path),
             self.make_deep_path,
             max_n=100,
@@ -78,7 +84,7 @@ class TestComplexity(unittest.TestCase):
 
     @pytest.mark.flaky
     def test_glob_depth(self):
-        best, others = big_o.big_o(
+        best, _ = big_o.big_o(
             lambda path: consume(path.glob('*.txt')),
             self.make_zip_path,
             max_n=100,
@@ -88,7 +94,7 @@ class TestComplexity(unittest.TestCase):
 
     @pytest.mark.flaky
     def test_glob_width(self):
-        best, others = big_o.big_o(
+        best, _ = big_o.big_o(
             lambda path: consume(path.glob('*.txt')),
             lambda size: self.make_zip_path(width=size),
             max_n=100,
@@ -98,10 +104,80 @@ class TestComplexity(unittest.TestCase):
 
     @pytest.mark.flaky
     def test_glob_width_and_depth(self):
-        best, others = big_o.big_o(
+        best, _ = big_o.big_o(
             lambda path: consume(path.glob('*.txt')),
             lambda size: self.make_zip_path(depth=size, width=size),
             max_n=10,
             min_n=1,
         )
         assert best <= big_o.complexities.Linear
+
+    @pytest.mark.flaky
+    def test_iterdir_walk(self):
+        """
+        Walking every directory with iterdir is linear in the entries.
+        """
+
+        def walk(path):
+            for child in path.iterdir():
+                if child.is_dir():
+                    walk(child)
+
+        best, _ = big_o.big_o(
+            walk,
+            lambda size: self.make_zip_path(depth=10, width=size, mode='r'),
+            max_n=1000,
+            min_n=10,
+            n_timings=5,
+        )
+        assert best <= big_o.complexities.Linear
+
+    @pytest.mark.flaky
+    def test_walk(self):
+        """
+        Path.walk is linear in the entries.
+        """
+        best, _ = big_o.big_o(
+            lambda path: consume(path.walk()),
+            lambda size: self.make_zip_path(depth=10, width=size, mode='r'),
+            max_n=1000,
+            min_n=10,
+            n_timings=5,
+        )
+        assert best <= big_o.complexities.Linear
+
+    @pytest.mark.flaky
+    def test_rglob_max_depth(self):
+        """
+        A depth-bounded rglob does not visit names beyond that depth.
+        """
+        best, _ = big_o.big_o(
+            lambda path: consume(path.rglob('*.txt', max_depth=2)),
+            lambda size: self.make_zip_path(depth=size, width=10, mode='r'),
+            max_n=1000,
+            min_n=10,
+            n_timings=5,
+        )
+        assert best <= big_o.complexities.Logarithmic
+
+    @pytest.mark.flaky
+    def test_write_and_probe(self):
+        """
+        Probing a writable archive after each write is linear overall.
+        """
+
+        def write_and_probe(names):
+            zf = zipfile.ZipFile(io.BytesIO(), mode='w')
+            root = zipfile.Path(zf)
+            for name in names:
+                zf.writestr(name, b'')
+                assert root.joinpath(name).exists()
+
+        best, _ = big_o.big_o(
+            write_and_probe,
+            lambda size: [f'd{n % 10}/{n}.txt' for n in range(size)],
+            max_n=1000,
+            min_n=10,
+            n_timings=5,
+        )
+        assert best <= big_o.complexities.Linear
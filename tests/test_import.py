@@ -0,0 +1,41 @@
+import os
+import pathlib
+import subprocess
+import sys
+import unittest
+
+import zipp
+
+deferred = {'concurrent.futures', 'mmap', 'pathlib', 're', 'typing', 'zipp.glob'}
+"""Modules zipp imports only when needed."""
+
+
+def import_times(statement):
+    """
+    Run statement in a new interpreter with ``-X importtime``,
+    returning the (module, cumulative microseconds) imported, in order.
+    """
+    env = dict(os.environ, PYTHONPATH=str(pathlib.Path(zipp.__file__).parent.parent))
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    lines = proc.stderr.splitlines()[1:]
+    fields = (line.split('|') for line in lines if line.startswith('import time:'))
+    return [(name.strip(), int(cumulative)) for _, cumulative, name in fields]
+
+
+class TestImport(unittest.TestCase):
+    def test_deferred(self):
+        """
+        Importing zipp imports no more than zipfile does of the modules
+        it defers.
+        """
+        times = import_times('import zipfile; import zipp')
+        names = [name for name, _ in times]
+        after_zipfile = names[names.index('zipfile') + 1 :]
+        assert 'zipp' in after_zipfile
+        assert not deferred.intersection(after_zipfile)
@@ -1,11 +1,20 @@
+import concurrent.futures
 import contextlib
+import functools
+import gc
 import io
 import itertools
+import mmap
+import os
 import pathlib
 import pickle
 import stat
 import sys
+import threading
+import time
+import tracemalloc
 import unittest
+from unittest import mock
 
 import jaraco.itertools
 from jaraco.functools import compose
@@ -108,6 +117,26 @@ class TestPath(unittest.TestCase):
         (i,) = h.iterdir()
         assert i.is_file()
 
+    @pass_alpharep
+    def test_iterdir_read_only(self, alpharep):
+        """
+        Children are resolved from the index on a read-only archive.
+        """
+        root = zipfile.Path(self.zipfile_ondisk(alpharep))
+        assert [child.name for child in root.iterdir()] == [
+            'a.txt',
+            'n.txt',
+            'b',
+            'g',
+            'j',
+        ]
+        assert [child.at for child in (root / 'b').iterdir()] == [
+            'b/c.txt',
+            'b/f.txt',
+            'b/d/',
+        ]
+        assert list((root / 'b/d/e.txt').parent.iterdir()) == [root / 'b/d/e.txt']
+
     @pass_alpharep
     def test_is_file_missing(self, alpharep):
         root = zipfile.Path(alpharep)
@@ -120,6 +149,117 @@ class TestPath(unittest.TestCase):
         with self.assertRaises(ValueError):
             a.iterdir()
 
+    @pass_alpharep
+    def test_walk(self, alpharep):
+        root = zipfile.Path(alpharep)
+        walked = [
+            (path.at, dirnames, filenames) for path, dirnames, filenames in root.walk()
+        ]
+        assert walked == [
+            ('', ['b', 'g', 'j'], ['a.txt', 'n.txt']),
+            ('b/', ['d'], ['c.txt', 'f.txt']),
+            ('b/d/', [], ['e.txt']),
+            ('g/', ['h'], []),
+            ('g/h/', [], ['i.txt']),
+            ('j/', [], ['k.bin', 'l.baz', 'm.bar']),
+        ]
+        assert [path.at for path, _, _ in (root / 'b').walk()] == ['b/', 'b/d/']
+
+    @pass_alpharep
+    def test_walk_bottom_up(self, alpharep):
+        root = zipfile.Path(alpharep)
+        walked = [path.at for path, _, _ in root.walk(top_down=False)]
+        assert walked == ['b/d/', 'b/', 'g/h/', 'g/', 'j/', '']
+
+    @pass_alpharep
+    def test_walk_prune(self, alpharep):
+        root = zipfile.Path(alpharep)
+        walked = []
+        for path, dirnames, _ in root.walk():
+            walked.append(path.at)
+            dirnames[:] = [name for name in dirnames if name != 'b'] + ['missing']
+        assert walked == ['', 'g/', 'g/h/', 'j/']
+
+    @pass_alpharep
+    def test_walk_not_dir(self, alpharep):
+        root = zipfile.Path(alpharep)
+        assert list((root / 'a.txt').walk()) == []
+        assert list((root / 'missing/').walk()) == []
+
+    @pass_alpharep
+    def test_stat(self, alpharep):
+        root = zipfile.Path(alpharep)
+        info = (root / 'b' / 'c.txt').stat()
+        assert info.st_size == len('content of c')
+        assert stat.S_ISREG(info.st_mode)
+        assert info.crc == alpharep.getinfo('b/c.txt').CRC
+        assert info.compress_type == zipfile.ZIP_STORED
+        assert info.st_mtime == time.mktime(
+            alpharep.getinfo('b/c.txt').date_time + (0, 0, -1)
+        )
+        assert stat.S_ISLNK((root / 'n.txt').stat().st_mode)
+        assert stat.S_ISDIR((root / 'g' / 'h').stat().st_mode)
+        assert stat.S_ISDIR(root.stat().st_mode)
+        with self.assertRaises(FileNotFoundError):
+            (root / 'missing.txt').stat()
+
+    @pass_alpharep
+    def test_stat_cached(self, alpharep):
+        root = zipfile.Path(self.zipfile_ondisk(alpharep))
+        assert (root / 'b' / 'c.txt').stat() is (root / 'b' / 'c.txt').stat()
+        assert (root / 'g').stat() is (root / 'g').stat()
+
+    def test_stat_synthesized_mode(self):
+        """
+        Members with no file type recorded (as archived on Windows)
+        get a regular file or directory mode.
+        """
+        zf = zipfile.ZipFile(io.BytesIO(), 'w')
+        for name in 'a.txt', 'b/':
+            info = zipfile.ZipInfo(name)
+            info.create_system = 0
+            zf.writestr(info, b'')
+            info.external_attr = 0x10 if name.endswith('/') else 0
+        root = zipfile.Path(zf)
+        assert (root / 'a.txt').stat().st_mode == stat.S_IFREG | 0o644
+        assert (root / 'b').stat().st_mode == stat.S_IFDIR | 0o755
+
+    @pass_alpharep
+    def test_read_many(self, alpharep):
+        root = zipfile.Path(alpharep)
+        read = [(path.at, data) for path, data in root.read_many('b/*')]
+        assert read == [
+            ('b/c.txt', b'content of c'),
+            ('b/f.txt', b'content of f'),
+        ]
+        names = ['j/m.bar', 'a.txt', 'b/d/e.txt']
+        read = [path.at for path, _ in root.read_many(names)]
+        assert read == ['a.txt', 'b/d/e.txt', 'j/m.bar']
+        paths = [root / name for name in names]
+        read = list((root / 'b').read_many(paths, order='request'))
+        assert [path for path, _ in read] == paths
+        assert read[0][1] == b'content of m'
+
+    @pass_alpharep
+    def test_read_many_sequential(self, alpharep):
+        root = zipfile.Path(self.zipfile_ondisk(alpharep))
+        read = dict(root.read_many('**/*.txt'))
+        assert read[root / 'b' / 'd' / 'e.txt'] == b'content of e'
+        assert len(read) == 4
+
+    @pass_alpharep
+    def test_read_many_invalid(self, alpharep):
+        root = zipfile.Path(alpharep)
+        with self.assertRaises(FileNotFoundError):
+            root.read_many(['a.txt', 'missing.txt'])
+        with self.assertRaises(IsADirectoryError):
+            root.read_many(['b'])
+        with self.assertRaises(ValueError):
+            root.read_many(['a.txt'], order='name')
+        other = zipfile.Path(build_alpharep_fixture())
+        with self.assertRaises(ValueError):
+            root.read_many([other / 'a.txt'])
+
     @pass_alpharep
     def test_subdir_is_dir(self, alpharep):
         root = zipfile.Path(alpharep)
@@ -245,6 +385,100 @@ class TestPath(unittest.TestCase):
         assert a.read_text("utf-8") == "content of a"
         assert a.read_bytes() == b"content of a"
 
+    @pass_alpharep
+    def test_read_buffer(self, alpharep):
+        root = zipfile.Path(alpharep)
+        buffer = root.joinpath('b/c.txt').read_buffer()
+        assert buffer.readonly
+        assert buffer == b"content of c"
+        with self.assertRaises(IsADirectoryError):
+            root.joinpath('b').read_buffer()
+        with self.assertRaises(FileNotFoundError):
+            root.joinpath('missing.txt').read_buffer()
+
+    @pass_alpharep
+    def test_read_buffer_mapped(self, alpharep):
+        """
+        Stored members of an archive on disk are mapped, not copied.
+        """
+        root = zipfile.Path(self.zipfile_ondisk(alpharep))
+        buffer = root.joinpath('b/d/e.txt').read_buffer()
+        assert isinstance(buffer.obj, mmap.mmap)
+        assert buffer == b"content of e"
+
+    @pass_alpharep
+    def test_read_buffer_closed(self, alpharep):
+        """
+        Closing the root unmaps the archive, once no views remain.
+        """
+        root = zipfile.Path(self.zipfile_ondisk(alpharep))
+        buffer = root.joinpath('b/c.txt').read_buffer()
+        mapped = buffer.obj
+        root.root.close()
+        assert not mapped.closed
+        assert buffer == b"content of c"
+        with self.assertRaises(ValueError):
+            root.joinpath('b/c.txt').read_buffer()
+
+        root = zipfile.Path(self.zipfile_ondisk(build_alpharep_fixture()))
+        with root.joinpath('b/c.txt').read_buffer() as buffer:
+            mapped = buffer.obj
+        root.root.close()
+        assert mapped.closed
+
+    def test_read_buffer_compressed(self):
+        data = io.BytesIO()
+        with zipfile.ZipFile(data, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('a.txt', b'content of a' * 100)
+        tmpdir = pathlib.Path(self.fixtures.enter_context(temp_dir()))
+        archive = tmpdir / 'deflated.zip'
+        archive.write_bytes(data.getvalue())
+        buffer = zipfile.Path(archive, 'a.txt').read_buffer()
+        assert isinstance(buffer.obj, bytes)
+        assert buffer == b'content of a' * 100
+
+    @pass_alpharep
+    def test_iter_chunks(self, alpharep):
+        root = zipfile.Path(alpharep)
+        path = root / 'b' / 'c.txt'
+        assert list(path.iter_chunks(5)) == [b'conte', b'nt of', b' c']
+        buffer = bytearray(5)
+        chunks = [bytes(chunk) for chunk in path.iter_chunks(buffer=buffer)]
+        assert chunks == [b'conte', b'nt of', b' c']
+        with self.assertRaises(IsADirectoryError):
+            (root / 'b').iter_chunks()
+        with self.assertRaises(FileNotFoundError):
+            (root / 'missing.txt').iter_chunks()
+
+    @pass_alpharep
+    def test_iter_chunks_mapped(self, alpharep):
+        """
+        Chunks of stored members on disk are copied from the map into
+        the buffer, and checked against the CRC.
+        """
+        archive = self.zipfile_ondisk(alpharep)
+        path = zipfile.Path(archive, 'b/d/e.txt')
+        assert list(path.iter_chunks(8)) == [b'content ', b'of e']
+        buffer = bytearray(8)
+        for chunk in path.iter_chunks(buffer=buffer):
+            assert chunk.obj is buffer
+        path.root.close()
+        data = archive.read_bytes()
+        archive.write_bytes(data.replace(b'content of e', b'content of E'))
+        path = zipfile.Path(archive, 'b/d/e.txt')
+        with self.assertRaises(zipfile.BadZipFile):
+            list(path.iter_chunks(buffer=buffer))
+
+    def test_iter_chunks_compressed(self):
+        data = io.BytesIO()
+        with zipfile.ZipFile(data, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('a.txt', b'content of a' * 100)
+        path = zipfile.Path(zipfile.ZipFile(data), 'a.txt')
+        buffer = memoryview(bytearray(500))
+        chunks = [bytes(chunk) for chunk in path.iter_chunks(buffer=buffer)]
+        assert list(map(len, chunks)) == [500, 500, 200]
+        assert b''.join(chunks) == b'content of a' * 100
+
     @pass_alpharep
     def test_joinpath(self, alpharep):
         root = zipfile.Path(alpharep)
@@ -313,6 +547,24 @@ class TestPath(unittest.TestCase):
         (baz,) = (root / 'bar').iterdir()
         assert baz.read_text(encoding="utf-8") == 'baz'
 
+    def test_mutability_incremental(self):
+        """
+        The names of a writable zipfile, probed between writes,
+        match those computed afresh.
+        """
+        zf = zipfile.ZipFile(io.BytesIO(), 'w')
+        root = zipfile.Path(zf)
+        names = ['a/b/c.txt', 'a/', 'a/d.txt', 'e/f/', 'e/f/g/h.txt', 'a/b/']
+        for name in names:
+            assert root.joinpath(name).exists() == (name in zf.namelist())
+            zf.writestr(name, b'')
+            assert root.joinpath(name).exists()
+            explicit = [info.filename for info in zf.filelist]
+            implied = zipfile._path.CompleteDirs._implied_dirs(explicit)
+            assert zf.namelist() == explicit + list(implied)
+        assert root.joinpath('e').at == 'e/'
+        assert zf.getinfo('e/f/g/').filename == 'e/f/g/'
+
     HUGE_ZIPFILE_NUM_ENTRIES = 2**13
 
     def huge_zipfile(self):
@@ -335,6 +587,23 @@ class TestPath(unittest.TestCase):
         # Check the file iterated all items
         assert entries.count == self.HUGE_ZIPFILE_NUM_ENTRIES
 
+    def test_path_memory(self):
+        """
+        Paths are compact and share the names in the root's index.
+        """
+        root = zipfile.Path(self.huge_zipfile())
+        names = root.root.namelist()
+        list(root.iterdir())
+        tracemalloc.start()
+        try:
+            paths = list(root.iterdir())
+            paths += map(root.joinpath, list(map(str, range(len(names)))))
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        assert all(path.at is name for path, name in zip(paths, names * 2))
+        assert size / len(paths) < 80
+
     @pass_alpharep
     def test_read_does_not_close(self, alpharep):
         alpharep = self.zipfile_ondisk(alpharep)
@@ -540,6 +809,185 @@ class TestPath(unittest.TestCase):
             zipfile.Path(alpharep, "j/l.baz"),
         ]
 
+    @pass_alpharep
+    def test_glob_read_only(self, alpharep):
+        """
+        Globbing a read-only archive, which prunes candidates by the
+        pattern's literal prefix, matches the same names in the same order.
+        """
+        patterns = ['b/*.txt', 'b/c.*', 'j/?.b[ai][nz]', 'g/h', '**/*.txt', 'x*']
+        writable = zipfile.Path(alpharep)
+        expected = [[path.at for path in writable.glob(p)] for p in patterns]
+        root = zipfile.Path(self.zipfile_ondisk(alpharep))
+        actual = [[path.at for path in root.glob(p)] for p in patterns]
+        assert actual == expected
+        assert [path.at for path in (root / 'b').glob('*.txt')] == [
+            'b/c.txt',
+            'b/f.txt',
+        ]
+
+    @pass_alpharep
+    def test_glob_shares_names(self, alpharep):
+        """
+        Paths found by glob hold the archive's names, not copies.
+        """
+        root = zipfile.Path(self.zipfile_ondisk(alpharep))
+        names = {id(name) for name in root.root.namelist()}
+        paths = list(root.glob('**/*'))
+        assert paths
+        assert all(id(path.at) in names for path in paths)
+
+    @pass_alpharep
+    def test_glob_cached(self, alpharep):
+        """
+        Repeated globs reuse the compiled pattern.
+        """
+        from zipp.glob import compile_lines
+
+        compile_lines.cache_clear()
+        root = zipfile.Path(alpharep)
+        for _ in range(3):
+            assert list(root.glob('*.txt')) == [root / 'a.txt', root / 'n.txt']
+        info = compile_lines.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+
+    @pass_alpharep
+    def test_glob_newlines(self, alpharep):
+        """
+        Names and patterns that may match newlines are matched by name.
+        """
+        alpharep.writestr('x\ny.txt', b'')
+        root = zipfile.Path(alpharep)
+        from zipp.glob import compile_pattern
+
+        compile_pattern.cache_clear()
+        assert [path.at for path in root.glob('*.txt')] == [
+            'a.txt',
+            'n.txt',
+            'x\ny.txt',
+        ]
+        assert [path.at for path in root.glob('x[^a]y.txt')] == ['x\ny.txt']
+        assert compile_pattern.cache_info().misses == 2
+
+    def check_glob_many(self, root, patterns):
+        """
+        glob_many yields what glob would for each pattern, by name.
+        """
+        names = root.root.namelist()
+        expected = sorted(
+            ((pattern, path) for pattern in patterns for path in root.glob(pattern)),
+            key=lambda item: (names.index(item[1].at), patterns.index(item[0])),
+        )
+        assert list(root.glob_many(patterns)) == expected
+        return expected
+
+    @pass_alpharep
+    def test_glob_many(self, alpharep):
+        root = zipfile.Path(alpharep)
+        patterns = ['**/*.txt', 'b/*', '*.txt', 'b', 'j/*.b?z', '*/METADATA']
+        tagged = self.check_glob_many(root, patterns)
+        assert [(pattern, path.at) for pattern, path in tagged[:4]] == [
+            ('*.txt', 'a.txt'),
+            ('**/*.txt', 'b/c.txt'),
+            ('b/*', 'b/c.txt'),
+            ('**/*.txt', 'b/d/e.txt'),
+        ]
+        names = {id(name) for name in alpharep.namelist()}
+        tagged = root.glob_many(patterns)
+        assert all(id(path.at) in names for pattern, path in tagged)
+        self.check_glob_many(root / 'b', ['*.txt', '*/*.txt', 'd'])
+        assert list(root.glob_many([])) == []
+        with self.assertRaises(ValueError):
+            root.glob_many(['*.txt', ''])
+
+    @pass_alpharep
+    def test_glob_many_newlines(self, alpharep):
+        alpharep.writestr('x\ny.txt', b'')
+        root = zipfile.Path(alpharep)
+        self.check_glob_many(root, ['*.txt', 'x?y.txt'])
+        self.check_glob_many(root, ['x[^a]y.txt', 'a.*'])
+
+    @pass_alpharep
+    def test_glob_max_depth(self, alpharep):
+        root = zipfile.Path(alpharep)
+        assert [path.at for path in root.rglob('*', max_depth=2)] == [
+            'b/c.txt',
+            'b/f.txt',
+            'b/d/',
+            'g/h/',
+            'j/k.bin',
+            'j/l.baz',
+            'j/m.bar',
+        ]
+        assert [path.at for path in (root / 'b').glob('*', max_depth=1)] == [
+            'b/c.txt',
+            'b/f.txt',
+            'b/d/',
+        ]
+        assert [path.at for path in root.glob('b/*.txt', max_depth=2)] == [
+            'b/c.txt',
+            'b/f.txt',
+        ]
+        assert list(root.glob('b/*', max_depth=1)) == []
+        assert list(root.rglob('*', max_depth=0)) == []
+        assert [path.at for path in (root / 'b').glob('**', max_depth=1)] == [
+            'b/',
+            'b/c.txt',
+            'b/f.txt',
+            'b/d/',
+        ]
+        assert [path.at for path in (root / 'g').glob('**', max_depth=0)] == ['g/']
+        assert [path.at for path in root.glob('[^x].txt', max_depth=1)] == [
+            'a.txt',
+            'n.txt',
+        ]
+
+    def test_glob_max_depth_duplicate_dirs(self):
+        """
+        A directory listed more than once is descended once.
+        """
+        zf = zipfile.ZipFile(io.BytesIO(), 'w')
+        zf.writestr('ab/', b'')
+        zf.writestr('ab/d.py', b'')
+        with self.assertWarns(UserWarning):  # duplicate name
+            zf.writestr('ab/', b'')
+        root = zipfile.Path(zf)
+        bounded = [path.at for path in root.rglob('*', max_depth=2)]
+        assert bounded == [path.at for path in root.rglob('*')] == ['ab/d.py']
+
+    @pass_alpharep
+    def test_glob_kind(self, alpharep):
+        root = zipfile.Path(alpharep)
+        assert [path.at for path in root.glob('*', kind='dir')] == ['b/', 'g/', 'j/']
+        assert [path.at for path in root.glob('*', kind='file')] == ['a.txt', 'n.txt']
+        assert list(root.rglob('*.txt', kind='file')) == list(root.rglob('*.txt'))
+        assert list(root.rglob('*.txt', kind='dir')) == []
+        assert [path.at for path in root.rglob('*', max_depth=2, kind='dir')] == [
+            'b/d/',
+            'g/h/',
+        ]
+        assert [path.at for path in root.glob('[^x]', kind='dir')] == ['b/', 'g/', 'j/']
+        with self.assertRaises(ValueError):
+            root.glob('*', kind='symlink')
+
+    @pass_alpharep
+    def test_glob_kind_recursive(self, alpharep):
+        """
+        Patterns ending in ** match paths of only the kind given.
+        """
+        root = zipfile.Path(alpharep)
+        for pattern, kind, max_depth in itertools.product(
+            ['**', 'a/**', 'b/**', '[^x]/**'], ['file', 'dir'], [None, 2]
+        ):
+            glob = functools.partial(root.glob, pattern, max_depth=max_depth)
+            expected = [path for path in glob() if path.is_dir() == (kind == 'dir')]
+            assert list(glob(kind=kind)) == expected
+        assert [path.at for path in root.glob('b/**', kind='dir')] == ['b/', 'b/d/']
+        assert [path.at for path in root.rglob('**', kind='file')][:2] == [
+            'b/c.txt',
+            'b/d/e.txt',
+        ]
+
     def test_glob_empty(self):
         root = zipfile.Path(zipfile.ZipFile(io.BytesIO(), 'w'))
         with self.assertRaises(ValueError):
@@ -561,6 +1009,25 @@ class TestPath(unittest.TestCase):
         root = zipfile.Path(alpharep)
         assert not root.joinpath('a.txt').is_symlink()
         assert root.joinpath('n.txt').is_symlink()
+        assert root.joinpath('n.txt').is_file()
+        assert not root.joinpath('b').is_symlink()
+        assert not root.joinpath('missing.txt').is_symlink()
+
+    def test_kinds(self):
+        """
+        A file and a directory may share a name (less the slash),
+        in which case the file is resolved by that name.
+        """
+        zf = zipfile.ZipFile(io.BytesIO(), 'w')
+        zf.writestr('b/c.txt', b'')
+        root = zipfile.Path(zf)
+        assert root.joinpath('b').at == 'b/'
+        assert root.joinpath('b').is_dir() and not root.joinpath('b').is_file()
+        zf.writestr('b', b'')
+        assert root.joinpath('b').at == 'b'
+        assert root.joinpath('b').is_file()
+        assert root.joinpath('b/').is_dir() and root.joinpath('b/').exists()
+        assert not root.joinpath('b/').is_file()
 
     @pass_alpharep
     def test_relative_to(self, alpharep):
@@ -588,10 +1055,13 @@ class TestPath(unittest.TestCase):
     def test_pickle(self, alpharep, path_type, subpath):
         zipfile_ondisk = path_type(str(self.zipfile_ondisk(alpharep)))
 
-        saved_1 = pickle.dumps(zipfile.Path(zipfile_ondisk, at=subpath))
-        restored_1 = pickle.loads(saved_1)
-        first, *rest = restored_1.iterdir()
-        assert first.read_text(encoding='utf-8').startswith('content of ')
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            path = zipfile.Path(zipfile_ondisk, at=subpath)
+            saved_1 = pickle.dumps(path, protocol)
+            restored_1 = pickle.loads(saved_1)
+            assert restored_1.at == path.at
+            first, *rest = restored_1.iterdir()
+            assert first.read_text(encoding='utf-8').startswith('content of ')
 
     @pass_alpharep
     def test_extract_orig_with_implied_dirs(self, alpharep):
@@ -604,6 +1074,121 @@ class TestPath(unittest.TestCase):
         zipfile.Path(zf)
         zf.extractall(source_path.parent)
 
+    @pass_alpharep
+    def test_extract_tree(self, alpharep):
+        root = zipfile.Path(self.zipfile_ondisk(alpharep))
+        dest = pathlib.Path(self.fixtures.enter_context(temp_dir()))
+        with mock.patch.object(
+            zipfile.ZipFile, '_RealGetContents', side_effect=AssertionError
+        ):
+            written = root.joinpath('b').extract_tree(dest, workers=2)
+        assert written == [
+            str(dest / name) for name in ['b/c.txt', 'b/d/e.txt', 'b/f.txt', 'b', 'b/d']
+        ]
+        assert (dest / 'b/d/e.txt').read_text(encoding='utf-8') == 'content of e'
+        assert not (dest / 'a.txt').exists()
+
+    @pass_alpharep
+    def test_extract_tree_processes(self, alpharep):
+        root = zipfile.Path(self.zipfile_ondisk(alpharep))
+        dest = pathlib.Path(self.fixtures.enter_context(temp_dir()))
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            written = root.extract_tree(dest, workers=2, executor=executor)
+        assert written == [
+            str(dest / name.rstrip('/')) for name in root.root.namelist()
+        ]
+        assert (dest / 'g/h/i.txt').read_text(encoding='utf-8') == 'content of i'
+        assert (dest / 'j/k.bin').read_bytes() == b'content of k'
+
+    def test_extract_tree_concurrent_dirs(self):
+        """
+        A directory made by another worker while extracting is tolerated.
+        """
+        makedirs = os.makedirs
+
+        def race(name, *args, **kwargs):
+            makedirs(name)
+            raise FileExistsError(name)
+
+        alpharep = build_alpharep_fixture()
+        root = zipfile.Path(self.zipfile_ondisk(alpharep))
+        dest = pathlib.Path(self.fixtures.enter_context(temp_dir()))
+        with mock.patch.object(os, 'makedirs', side_effect=race):
+            (root / 'b' / 'c.txt').extract_tree(dest, workers=1)
+        assert (dest / 'b/c.txt').read_text(encoding='utf-8') == 'content of c'
+
+    def test_extract_tree_writable(self):
+        """
+        Members of an archive being written are extracted from it.
+        """
+        tmpdir = pathlib.Path(self.fixtures.enter_context(temp_dir()))
+        dest = tmpdir / 'dest'
+        with zipfile.ZipFile(tmpdir / 'a.zip', 'w') as zf:
+            zf.writestr('b/c.txt', b'content of c')
+            zipfile.Path(zf).extract_tree(dest, workers=2)
+        with zipfile.ZipFile(tmpdir / 'a.zip', 'a') as zf:
+            zf.writestr('b/d.txt', b'content of d')
+            zipfile.Path(zf, 'b/').extract_tree(dest, workers=2)
+        assert (dest / 'b/c.txt').read_bytes() == b'content of c'
+        assert (dest / 'b/d.txt').read_bytes() == b'content of d'
+
+    @pass_alpharep
+    def test_extract_tree_in_memory(self, alpharep):
+        root = zipfile.Path(alpharep)
+        dest = pathlib.Path(self.fixtures.enter_context(temp_dir()))
+        (written,) = root.joinpath('a.txt').extract_tree(dest)
+        assert pathlib.Path(written).read_text(encoding='utf-8') == 'content of a'
+        with self.assertRaises(FileNotFoundError):
+            root.joinpath('missing').extract_tree(dest)
+
+    @pass_alpharep
+    def test_per_thread(self, alpharep):
+        """
+        With per_thread, each thread reads through its own handle.
+        """
+        root = zipfile.Path(self.zipfile_ondisk(alpharep))
+        root.root.per_thread = True
+        files = [path for path in root.rglob('*') if path.is_file()]
+        barrier = threading.Barrier(4)
+        handles = []
+
+        def read_all():
+            barrier.wait()
+            contents = [path.read_bytes() for path in files]
+            handles.append(root.root._thread_handle())
+            return contents
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(read_all) for _ in range(4)]
+        expected = [path.read_bytes() for path in files]
+        assert all(future.result() == expected for future in futures)
+        handles.append(root.root._thread_handle())
+        assert len({id(handle.fp) for handle in handles}) == len(handles) == 5
+        assert all(handle.NameToInfo is root.root.NameToInfo for handle in handles)
+        root.root.close()
+        assert all(handle.fp is None for handle in handles)
+
+    @pass_alpharep
+    def test_per_thread_ended(self, alpharep):
+        """
+        A thread's handle is closed when the thread ends.
+        """
+        root = zipfile.Path(self.zipfile_ondisk(alpharep))
+        root.root.per_thread = True
+        files = []
+
+        def read():
+            assert (root / 'a.txt').read_bytes() == b'content of a'
+            files.append(root.root._thread_handle().fp)
+
+        for _ in range(3):
+            thread = threading.Thread(target=read)
+            thread.start()
+            thread.join()
+        gc.collect()
+        assert len(files) == 3 and all(file.closed for file in files)
+        assert not root.root._handles
+
     @pass_alpharep
     def test_getinfo_missing(self, alpharep):
         """
@@ -0,0 +1,111 @@
+import concurrent.futures
+import contextlib
+import operator
+import os
+import pathlib
+import pickle
+import unittest
+from unittest import mock
+
+import zipp
+from zipp import registry
+from zipp.registry import Registry
+
+from ._support import write_alpharep
+from .compat.py39.os_helper import temp_dir  # type: ignore[import-not-found]
+
+
+class TestRegistry(unittest.TestCase):
+    def setUp(self):
+        self.fixtures = contextlib.ExitStack()
+        self.addCleanup(self.fixtures.close)
+        self.tmpdir = pathlib.Path(self.fixtures.enter_context(temp_dir()))
+        self.registry = Registry(maxsize=2)
+
+    def write_archive(self, name='alpharep.zip'):
+        return write_alpharep(self.tmpdir, name)
+
+    def test_reuses_root(self):
+        archive = self.write_archive()
+        root = self.registry.lookup(archive)
+        assert isinstance(root, zipp.FastLookup)
+        assert self.registry.lookup(str(archive)) is root
+        path = zipp.Path(self.registry.lookup(archive), 'b/c.txt')
+        assert path.root is root
+        assert path.read_text(encoding='utf-8') == 'content of c'
+
+    def test_changed_archive(self):
+        archive = self.write_archive()
+        root = self.registry.lookup(archive)
+        with archive.open('ab') as strm:
+            strm.write(b'trailing')
+        assert self.registry.lookup(archive) is not root
+        assert len(self.registry) == 1
+
+    def test_invalidate(self):
+        archive = self.write_archive()
+        root = self.registry.lookup(archive)
+        self.registry.invalidate(archive)
+        assert self.registry.lookup(archive) is not root
+        self.registry.invalidate()
+        assert len(self.registry) == 0
+
+    def test_eviction(self):
+        first, second, third = map(self.write_archive, ['1.zip', '2.zip', '3.zip'])
+        root = self.registry.lookup(first)
+        self.registry.lookup(second)
+        assert self.registry.lookup(first) is root
+        self.registry.lookup(third)
+        assert len(self.registry) == 2
+        assert self.registry.lookup(first) is root
+        assert os.path.realpath(second) not in (key[0] for key in self.registry._roots)
+
+    def test_pickle(self):
+        """
+        Paths on registered roots pickle by the archive's identity,
+        restored from the process-wide registry without parsing.
+        """
+        archive = self.write_archive()
+        path = zipp.Path(registry.lookup(archive), 'b/c.txt')
+        self.addCleanup(registry.invalidate, archive)
+        data = pickle.dumps(path)
+        assert len(data) < 400
+        with mock.patch.object(
+            zipp.FastLookup, '_RealGetContents', side_effect=AssertionError
+        ):
+            restored = pickle.loads(data)
+        assert restored == path
+        assert restored.root is path.root
+
+    def test_pickle_other_registry(self):
+        """
+        Paths on roots from any other registry pickle by filename,
+        re-opening the archive rather than resolving it from the
+        process-wide registry.
+        """
+        archive = self.write_archive()
+        path = zipp.Path(self.registry.lookup(archive), 'b/c.txt')
+        with mock.patch.object(registry, 'lookup', side_effect=AssertionError):
+            restored = pickle.loads(pickle.dumps(path))
+        self.addCleanup(restored.root.close)
+        assert restored.root is not path.root
+        assert restored.read_text(encoding='utf-8') == 'content of c'
+
+    def test_pickle_changed(self):
+        archive = self.write_archive()
+        path = zipp.Path(registry.lookup(archive), 'b/c.txt')
+        self.addCleanup(registry.invalidate, archive)
+        data = pickle.dumps(path)
+        with archive.open('ab') as strm:
+            strm.write(b'trailing')
+        with self.assertRaises(ValueError):
+            pickle.loads(data)
+
+    def test_pickle_processes(self):
+        archive = self.write_archive()
+        root = zipp.Path(registry.lookup(archive))
+        self.addCleanup(registry.invalidate, archive)
+        paths = list(root.rglob('*.txt'))
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            contents = executor.map(operator.methodcaller('read_bytes'), paths)
+            assert list(contents) == [path.read_bytes() for path in paths]
@@ -0,0 +1,127 @@
+import concurrent.futures
+import contextlib
+import io
+import pickle
+import tracemalloc
+import unittest
+from unittest import mock
+
+import zipp
+from zipp.compat.overlay import zipfile
+from zipp.shared import SharedArchive, SharedLookup, attach
+
+from ._support import alpharep_bytes, write_alpharep
+from .compat.py39.os_helper import temp_dir  # type: ignore[import-not-found]
+
+
+def parsed_alpharep():
+    """
+    The alpharep fixture, as parsed by a reader.
+    """
+    return zipfile.ZipFile(io.BytesIO(alpharep_bytes()))
+
+
+def read_shared(name, at):
+    return zipp.Path(attach(name), at).read_bytes()
+
+
+class TestShared(unittest.TestCase):
+    def setUp(self):
+        self.fixtures = contextlib.ExitStack()
+        self.addCleanup(self.fixtures.close)
+
+    def publish(self, source, **kwargs):
+        shared = self.fixtures.enter_context(SharedArchive(source, **kwargs))
+        root = SharedLookup(shared.name)
+        self.fixtures.callback(root.close)
+        return shared, zipp.Path(root)
+
+    def no_parse(self):
+        return mock.patch.object(
+            zipfile.ZipFile, '_RealGetContents', side_effect=AssertionError
+        )
+
+    def check(self, root):
+        assert [path.name for path in root.iterdir()] == [
+            'a.txt',
+            'n.txt',
+            'b',
+            'g',
+            'j',
+        ]
+        assert (root / 'b' / 'd' / 'e.txt').read_text(encoding='utf-8') == (
+            'content of e'
+        )
+        assert (root / 'n.txt').is_symlink()
+
+    def test_in_memory(self):
+        alpharep = parsed_alpharep()
+        with self.no_parse():
+            _, root = self.publish(alpharep)
+        self.check(root)
+        buffer = (root / 'b' / 'c.txt').read_buffer()
+        assert buffer == b'content of c'
+        assert buffer.obj is root.root._data.obj
+        del buffer
+
+    def test_on_disk(self):
+        archive = write_alpharep(self.fixtures.enter_context(temp_dir()))
+        _, root = self.publish(zipp.FastLookup(archive))
+        assert root.root._data is None
+        self.check(root)
+        _, root = self.publish(zipp.FastLookup(archive), data=True)
+        assert root.root._data is not None
+        self.check(root)
+
+    def test_pickle(self):
+        shared, _ = self.publish(parsed_alpharep())
+        path = zipp.Path(attach(shared.name), 'b/c.txt')
+        self.fixtures.callback(path.root.close)
+        data = pickle.dumps(path)
+        assert len(data) < 200
+        assert pickle.loads(data).root is path.root
+
+    def test_processes(self):
+        shared, root = self.publish(parsed_alpharep())
+        names = [path.at for path in root.rglob('*.txt')]
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            contents = executor.map(read_shared, [shared.name] * len(names), names)
+            assert list(contents) == [(root / name).read_bytes() for name in names]
+        paths = [zipp.Path(attach(shared.name), name) for name in names[:2]]
+        self.fixtures.callback(paths[0].root.close)
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            contents = executor.map(zipp.Path.read_bytes, paths)
+            assert list(contents) == [path.read_bytes() for path in paths]
+
+    def test_memory(self):
+        """
+        Attaching to an archive, and reading a member of it, retains
+        about the same memory however many members it has.
+        """
+
+        def retained(count):
+            data = io.BytesIO()
+            with zipfile.ZipFile(data, 'w') as zf:
+                for n in range(count):
+                    zf.writestr(f'pkg/sub{n % 50}/mod{n}.py', b'')
+            shared, _ = self.publish(zipfile.ZipFile(data))
+            tracemalloc.start()
+            try:
+                root = SharedLookup(shared.name)
+                root.read(f'pkg/sub{count // 2 % 50}/mod{count // 2}.py')
+                size = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+            root.close()
+            return size
+
+        small, large = retained(100), retained(10_000)
+        assert large < small * 1.5
+
+    def test_not_shared(self):
+        with SharedArchive(parsed_alpharep()) as shared:
+            with shared._shm.buf.toreadonly() as view:
+                assert bytes(view[:8]) == b'zippshm2'
+            shared._shm.buf[:8] = b'x' * 8
+            with self.assertRaises(ValueError):
+                SharedLookup(shared.name)
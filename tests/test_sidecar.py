@@ -0,0 +1,87 @@
+import contextlib
+import io
+import pathlib
+import stat
+import unittest
+from unittest import mock
+
+import zipp
+from zipp.compat.overlay import zipfile
+from zipp.sidecar import IndexedLookup
+
+from ._support import alpharep_bytes, write_alpharep
+from .compat.py39.os_helper import temp_dir  # type: ignore[import-not-found]
+
+
+class TestSidecar(unittest.TestCase):
+    def setUp(self):
+        self.fixtures = contextlib.ExitStack()
+        self.addCleanup(self.fixtures.close)
+        tmpdir = pathlib.Path(self.fixtures.enter_context(temp_dir()))
+        self.archive = write_alpharep(tmpdir)
+        self.sidecar = tmpdir / 'alpharep.zip.zippidx'
+
+    def open(self):
+        root = IndexedLookup(self.archive)
+        self.addCleanup(root.close)
+        return root
+
+    def no_parse(self):
+        return mock.patch.object(
+            zipfile.ZipFile, '_RealGetContents', side_effect=AssertionError
+        )
+
+    def test_written_and_loaded(self):
+        assert not self.sidecar.exists()
+        parsed = self.open()
+        assert self.sidecar.exists()
+        with self.no_parse():
+            loaded = self.open()
+        assert loaded.namelist() == parsed.namelist()
+        for expected, actual in zip(parsed.infolist(), loaded.infolist()):
+            assert repr(actual) == repr(expected)
+            assert actual.date_time == expected.date_time
+        root = zipp.Path(loaded)
+        assert (root / 'b' / 'd' / 'e.txt').read_text(encoding='utf-8') == (
+            'content of e'
+        )
+        assert [path.name for path in root.iterdir()] == [
+            'a.txt',
+            'n.txt',
+            'b',
+            'g',
+            'j',
+        ]
+        assert (root / 'n.txt').is_symlink()
+
+    def test_stale(self):
+        self.open()
+        with zipfile.ZipFile(self.archive, 'a') as zf:
+            zf.writestr('z.txt', 'content of z')
+        with self.no_parse(), self.assertRaises(AssertionError):
+            self.open()
+        assert 'z.txt' in self.open().namelist()
+        with self.no_parse():
+            assert 'z.txt' in self.open().namelist()
+
+    def test_corrupt(self):
+        self.sidecar.write_bytes(b'not json')
+        assert 'b/d/' in self.open().namelist()
+        with self.no_parse():
+            self.open()
+
+    def test_mode(self):
+        """
+        The sidecar is as readable as the archive it indexes.
+        """
+        self.archive.chmod(0o644)
+        self.open()
+        assert stat.S_IMODE(self.sidecar.stat().st_mode) & 0o044 == 0o044
+
+    def test_in_memory(self):
+        """
+        Archives not backed by a file are parsed as usual.
+        """
+        root = IndexedLookup(io.BytesIO(alpharep_bytes()))
+        assert 'b/d/' in root.namelist()
+        assert not self.sidecar.exists()
@@ -7,18 +7,24 @@ https://github.com/python/importlib_metadata/wiki/Development-Methodology
 for more detail.
 """
 
+import binascii
+import bisect
+import collections
+import contextlib
 import functools
 import io
 import itertools
-import pathlib
+import operator
+import os
 import posixpath
-import re
 import stat
+import struct
+import threading
+import time
 import zipfile
 
 from ._functools import none_as, save_method_args
 from .compat.py310 import text_encoding
-from .glob import Translator
 
 __all__ = ['Path']
 
@@ -81,6 +87,163 @@ def _difference(minuend, subtrahend):
     return itertools.filterfalse(set(subtrahend).__contains__, minuend)
 
 
+_FILE, _SYMLINK, _DIR, _IMPLIED = 1, 3, 4, 12
+"""The kinds of names, as flags: a symlink is a file, an implied dir a dir."""
+
+
+def _kind(name, external_attr):
+    """
+    >>> _kind('a.txt', 0), _kind('b/', 0), _kind('n.txt', 0o120777 << 16)
+    (1, 4, 3)
+    """
+    if name.endswith('/'):
+        return _DIR
+    return _SYMLINK if stat.S_ISLNK(external_attr >> 16) else _FILE
+
+
+class _Names:
+    """
+    The names in a zipfile, including implied directories,
+    maintained incrementally as members are added.
+
+    Each name is indexed with its kind, and resolves to one (canonical)
+    string, so paths may share it rather than each holding an equal
+    copy. A directory also resolves from its name without the
+    trailing slash (unless that's a name itself).
+
+    >>> members = [('b/d/e.txt', 0), ('b/c.txt', 0)]
+    >>> names = _Names()
+    >>> names.update(len(members), members.__getitem__)
+    >>> list(names)
+    ['b/d/e.txt', 'b/c.txt', 'b/d/', 'b/']
+    >>> members.append(('b/', 0))
+    >>> names.update(len(members), members.__getitem__)
+    >>> list(names)
+    ['b/d/e.txt', 'b/c.txt', 'b/', 'b/d/']
+    >>> names.resolve('b/' + 'c.txt') is members[1][0]
+    True
+    >>> names.resolve('b/d'), names.kind('b/d/') == _IMPLIED
+    ('b/d/', True)
+    """
+
+    def __init__(self, members=(), implied=(), count=0):
+        self.explicit = []
+        self.implied = dict.fromkeys(implied)
+        self.kinds = dict.fromkeys(self.implied, _IMPLIED)
+        for name, external_attr in members:
+            self.explicit.append(name)
+            self.kinds[name] = _kind(name, external_attr)
+        self.resolved = {}
+        for name in itertools.chain(self.implied, self.explicit):
+            self._resolve(name)
+        self.count = count
+
+    def update(self, count, members_from):
+        """
+        Incorporate any members added since the last update, given
+        the count of members and a function resolving the names and
+        external attributes of members from a slice.
+        """
+        if count < self.count:
+            self.__init__()
+        if count > self.count:
+            for name, external_attr in members_from(slice(self.count, None)):
+                self._add(name, _kind(name, external_attr))
+        self.count = count
+
+    def _add(self, name, kind):
+        self.explicit.append(name)
+        self.implied.pop(name, None)
+        self.kinds[name] = kind
+        self._resolve(name)
+        # ancestors of known names are known, so stop at the first
+        for parent in _parents(name):
+            dirname = parent + posixpath.sep
+            if dirname in self.kinds:
+                break
+            self.implied[dirname] = None
+            self.kinds[dirname] = _IMPLIED
+            self._resolve(dirname)
+
+    def _resolve(self, name):
+        self.resolved[name] = name
+        alias = name[:-1]
+        if name.endswith('/') and alias not in self.kinds:
+            self.resolved[alias] = name
+
+    def resolve(self, name):
+        """
+        Return the string to which name resolves, or name if unknown.
+        """
+        return self.resolved.get(name, name)
+
+    def kind(self, name):
+        """
+        Return the kind of name, or 0 if unknown.
+        """
+        return self.kinds.get(name, 0)
+
+    def __contains__(self, name):
+        return name in self.kinds
+
+    def __iter__(self):
+        return itertools.chain(self.explicit, self.implied)
+
+
+def _mode(name, external_attr):
+    """
+    Return the mode of the member name from its external attributes,
+    synthesizing one where the archiver recorded no file type (such
+    as archives made on Windows).
+
+    >>> oct(_mode('a.txt', 0o100600 << 16))
+    '0o100600'
+    >>> oct(_mode('a.txt', 0))
+    '0o100644'
+    >>> oct(_mode('b/', 0x10))
+    '0o40755'
+    """
+    mode = external_attr >> 16
+    if stat.S_IFMT(mode):
+        return mode
+    is_dir = name.endswith('/')
+    kind = stat.S_IFDIR if is_dir else stat.S_IFREG
+    return kind | (stat.S_IMODE(mode) or (0o755 if is_dir else 0o644))
+
+
+class StatResult(
+    collections.namedtuple(  # noqa: PYI024
+        'StatResult', 'st_mode st_size st_mtime compress_size crc compress_type'
+    )
+):
+    """
+    The metadata of a member, after :class:`os.stat_result`, with
+    its compressed size, CRC, and compression method.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _build(
+        cls, name, external_attr, date_time, file_size, compress_size, crc, method
+    ):
+        mtime = time.mktime(tuple(date_time) + (0, 0, -1))
+        mode = _mode(name, external_attr)
+        return cls(mode, file_size, mtime, compress_size, crc, method)
+
+    @classmethod
+    def _from_info(cls, info):
+        return cls._build(
+            info.filename,
+            info.external_attr,
+            info.date_time,
+            info.file_size,
+            info.compress_size,
+            info.CRC,
+            info.compress_type,
+        )
+
+
 class InitializedState:
     """
     Mix-in to save the initialization state for pickling.
@@ -109,6 +272,12 @@ class CompleteDirs(InitializedState, zipfile.ZipFile):
     ['foo/']
     """
 
+    content_cache = None
+    """
+    Set to a :class:`zipp.cache.ContentCache` to serve repeated
+    reads of members from their cached contents.
+    """
+
     @staticmethod
     def _implied_dirs(names):
         parents = itertools.chain.from_iterable(map(_parents, names))
@@ -116,21 +285,36 @@ class CompleteDirs(InitializedState, zipfile.ZipFile):
         return _dedupe(_difference(as_dirs, names))
 
     def namelist(self):
-        names = super().namelist()
-        return names + list(self._implied_dirs(names))
+        return list(self._names())
 
     def _name_set(self):
-        return set(self.namelist())
+        return self._names()
+
+    def _names(self):
+        """
+        Return the names index, updated for any members added.
+        """
+        names = self._names_prop
+        names.update(len(self.filelist), self._member_entries)
+        return names
+
+    def _member_entries(self, members):
+        """
+        Return the names and external attributes of the members
+        in the slice, in archive order.
+        """
+        return [(info.filename, info.external_attr) for info in self.filelist[members]]
+
+    @functools.cached_property
+    def _names_prop(self):
+        return _Names()
 
     def resolve_dir(self, name):
         """
         If the name represents a directory, return that name
         as a directory (with the trailing slash).
         """
-        names = self._name_set()
-        dirname = name + '/'
-        dir_match = name not in names and dirname in names
-        return dirname if dir_match else name
+        return self._name_set().resolve(name)
 
     def getinfo(self, name):
         """
@@ -143,6 +327,79 @@ class CompleteDirs(InitializedState, zipfile.ZipFile):
                 raise
             return zipfile.ZipInfo(filename=name)
 
+    def _stat(self, name):
+        """
+        Return the StatResult for the member or directory name
+        (or the root, if name is empty).
+        """
+        try:
+            return StatResult._from_info(super().getinfo(name))
+        except KeyError:
+            if name and name not in self._name_set():
+                raise
+        # an implied directory or the root, dated to the zip epoch
+        return StatResult._build(
+            name or '/', 0, (1980, 1, 1, 0, 0, 0), 0, 0, 0, zipfile.ZIP_STORED
+        )
+
+    def _tree(self):
+        """
+        Map each directory (without trailing slash) to the names
+        of its direct children, in namelist order.
+
+        >>> zf = CompleteDirs(io.BytesIO(), 'w')
+        >>> zf.writestr('b/c.txt', '')
+        >>> zf.writestr('b/d/e.txt', '')
+        >>> dict(zf._tree())
+        {'b': ['b/c.txt', 'b/d/'], 'b/d': ['b/d/e.txt'], '': ['b/']}
+        """
+        tree = collections.defaultdict(list)
+        for name in self.namelist():
+            tree[posixpath.dirname(name.rstrip('/'))].append(name)
+        return tree
+
+    def _children(self, name):
+        """
+        Return the names of the direct children of the directory name.
+        """
+        return self._tree().get(name.rstrip('/'), [])
+
+    def _names_with_prefix(self, prefix):
+        """
+        Return the names beginning with prefix, in namelist order.
+        """
+        return [name for name in self.namelist() if name.startswith(prefix)]
+
+    def _names_blob(self, prefix):
+        """
+        Return the names beginning with prefix joined into one string,
+        as searched by :func:`zipp.glob.compile_lines`, or None if
+        they cannot be.
+        """
+        from .glob import names_blob
+
+        return names_blob(self._names_with_prefix(prefix))
+
+    def _data_view(self, name):
+        """
+        Return a zero-copy view of the data for member name, or
+        None if it cannot be mapped.
+        """
+
+    def _reopenable(self):
+        """
+        Whether the archive was opened from a filename, such that
+        independent handles may be opened on it.
+        """
+        return not vars(self).get('_filePassed', True)
+
+    def _sequential(self):
+        """
+        Return a context for a handle through which to read many
+        members in order of their offsets.
+        """
+        return contextlib.nullcontext(self)
+
     @classmethod
     def make(cls, source):
         """
@@ -179,6 +436,85 @@ class FastLookup(CompleteDirs):
     dirs exist and are resolved rapidly.
     """
 
+    per_thread = False
+    """
+    Set to read through a file handle private to each thread (for
+    archives opened from a filename), sharing the parsed members,
+    so concurrent reads don't contend for one handle. Each handle is
+    closed when its thread ends, or when the root is closed.
+    """
+
+    def open(self, name, mode='r', pwd=None, **kwargs):
+        if mode == 'r' and self.per_thread and self._reopenable():
+            return self._thread_handle().open(name, mode, pwd=pwd, **kwargs)
+        return super().open(name, mode, pwd=pwd, **kwargs)
+
+    def _thread_handle(self):
+        try:
+            return self._local.handle
+        except AttributeError:
+            pass
+        handle = self._local.handle = self._clone()
+        with self._lock:
+            self._handles.add(handle)
+        return handle
+
+    @functools.cached_property
+    def _local(self):
+        return threading.local()
+
+    @functools.cached_property
+    def _handles(self):
+        """
+        The open thread handles, held only by their threads' locals,
+        so each is collected (and closed) when its thread ends.
+        """
+        import weakref
+
+        return weakref.WeakSet()
+
+    def _clone(self, buffering=-1):
+        """
+        Open a new handle on the archive, sharing the parsed members.
+        """
+        clone = zipfile.ZipFile.__new__(zipfile.ZipFile)
+        vars(clone).update(vars(self))
+        clone.fp = open(self.filename, 'rb', buffering=buffering)  # noqa: SIM115
+        vars(clone).update(_fileRefCnt=1, _lock=threading.RLock())
+        return clone
+
+    sequential_buffer = 2**20
+    """
+    The size of the buffer through which :meth:`Path.read_many`
+    reads an archive opened from a filename.
+    """
+
+    def _sequential(self):
+        """
+        Read through a new handle with a large buffer, where possible.
+        """
+        if not self._reopenable():
+            return super()._sequential()
+        return contextlib.closing(self._clone(buffering=self.sequential_buffer))
+
+    def close(self):
+        for handle in list(vars(self).pop('_handles', [])):
+            handle.close()
+        _release(vars(self).pop('_mmap', None))
+        super().close()
+
+    def _stat(self, name):
+        try:
+            return self._stats[name]
+        except KeyError:
+            pass
+        result = self._stats[name] = super()._stat(name)
+        return result
+
+    @functools.cached_property
+    def _stats(self):
+        return {}
+
     def namelist(self):
         return self._namelist
 
@@ -193,6 +529,111 @@ class FastLookup(CompleteDirs):
     def _name_set_prop(self):
         return super()._name_set()
 
+    def _tree(self):
+        return self._tree_prop
+
+    @functools.cached_property
+    def _tree_prop(self):
+        return super()._tree()
+
+    def _names_with_prefix(self, prefix):
+        """
+        Locate the names beginning with prefix by bisecting a sorted
+        index, then restore namelist order.
+        """
+        if not prefix:
+            return self.namelist()
+        index = self._sorted_index
+        start = bisect.bisect_left(index, prefix, key=operator.itemgetter(0))
+        candidates = itertools.takewhile(
+            lambda item: item[0].startswith(prefix),
+            itertools.islice(index, start, None),
+        )
+        return [name for name, _ in sorted(candidates, key=operator.itemgetter(1))]
+
+    def _names_blob(self, prefix):
+        return super()._names_blob(prefix) if prefix else self._blob
+
+    @functools.cached_property
+    def _blob(self):
+        return super()._names_blob('')
+
+    @functools.cached_property
+    def _sorted_index(self):
+        """
+        Each name paired with its position in the namelist, sorted by name.
+        """
+        return sorted(zip(self.namelist(), itertools.count()))
+
+    def _data_view(self, name):
+        """
+        Map the data for an unencrypted member stored without
+        compression directly from the archive on disk.
+        """
+        info = self.getinfo(name)
+        if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+            return None
+        if self.fp is None or self._mmap is None:
+            return None
+        start = _data_offset(self._mmap, info.header_offset)
+        if start + info.file_size > len(self._mmap):
+            raise zipfile.BadZipFile(f"Truncated member {name!r}")
+        return memoryview(self._mmap)[start : start + info.file_size]
+
+    @functools.cached_property
+    def _mmap(self):
+        try:
+            fileno = self.fp.fileno()
+        except (AttributeError, OSError):
+            return None
+        import mmap
+
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+
+def _release(buffer):
+    """
+    Close a memory map (or release a view), unless views of it remain,
+    in which case it's released with the last of them.
+    """
+    with contextlib.suppress(BufferError):
+        if isinstance(buffer, memoryview):
+            buffer.release()
+        elif buffer is not None:
+            buffer.close()
+
+
+def _data_offset(buffer, header_offset):
+    """
+    Given the offset of a local file header in buffer, return the
+    offset of the member's data, just past the header's fixed fields
+    (30 bytes), filename, and extra field.
+    """
+    if buffer[header_offset : header_offset + 4] != b'PK\x03\x04':
+        raise zipfile.BadZipFile("Bad magic number for file header")
+    name_length, extra_length = struct.unpack_from('<HH', buffer, header_offset + 26)
+    return header_offset + 30 + name_length + extra_length
+
+
+def _extract(opener, members, dest):
+    """
+    Extract members (names or infos) through a new handle on the
+    archive, as returned by opener.
+    """
+    with contextlib.closing(opener()) as zf:
+        return [_extract_member(zf, member, dest) for member in members]
+
+
+def _extract_member(zf, member, dest):
+    """
+    Extract member, tolerating a directory for it created concurrently
+    (by another worker) between checking for and making it.
+    """
+    try:
+        return zf.extract(member, dest)
+    except FileExistsError:
+        return zf.extract(member, dest)
+
 
 def _extract_text_encoding(encoding=None, *args, **kwargs):
     stack_level = 3
@@ -274,6 +715,7 @@ class Path:
     'mem/abcde.zip'
     >>> path.name
     'abcde.zip'
+    >>> import pathlib
     >>> path.filename == pathlib.Path('mem/abcde.zip')
     True
     >>> str(path.parent)
@@ -302,6 +744,8 @@ class Path:
     >>> pass
     """
 
+    __slots__ = ('at', 'root')
+
     __repr = "{self.__class__.__name__}({self.root.filename!r}, {self.at!r})"
 
     def __init__(self, root, at=""):
@@ -350,6 +794,8 @@ class Path:
         return io.TextIOWrapper(stream, encoding, *args, **kwargs)
 
     def _base(self):
+        import pathlib
+
         return pathlib.PurePosixPath(self.at) if self.at else self.filename
 
     @property
@@ -370,19 +816,163 @@ class Path:
 
     @property
     def filename(self):
+        import pathlib
+
         return pathlib.Path(self.root.filename).joinpath(self.at)
 
     def read_text(self, *args, **kwargs):
         encoding, args, kwargs = _extract_text_encoding(*args, **kwargs)
+        if self.root.content_cache is not None:
+            data = io.BytesIO(self.read_bytes())
+            return io.TextIOWrapper(data, encoding, *args, **kwargs).read()
         with self.open('r', encoding, *args, **kwargs) as strm:
             return strm.read()
 
     def read_bytes(self):
-        with self.open('rb') as strm:
-            return strm.read()
+        cache = self.root.content_cache
+        if cache is None:
+            with self.open('rb') as strm:
+                return strm.read()
+        if self.is_dir():
+            raise IsADirectoryError(self)
+        if not self.exists():
+            raise FileNotFoundError(self)
+        info = self.root.getinfo(self.at)
+        key = self.at, info.header_offset, info.CRC
+        data = cache.get(key)
+        if data is None:
+            with self.open('rb') as strm:
+                data = strm.read()
+            cache.put(key, data)
+        return data
+
+    def read_buffer(self):
+        """
+        Return the contents as a read-only :class:`memoryview`.
 
-    def _is_child(self, path):
-        return posixpath.dirname(path.at.rstrip("/")) == self.at.rstrip("/")
+        For a member stored without compression in a read-only
+        archive on disk, the view is of a memory map of the archive,
+        so no copy is made (and the CRC is not checked). Otherwise,
+        it's a view of the bytes read.
+        """
+        if self.is_dir():
+            raise IsADirectoryError(self)
+        if not self.exists():
+            raise FileNotFoundError(self)
+        view = self.root._data_view(self.at)
+        return memoryview(self.read_bytes()) if view is None else view
+
+    def stat(self):
+        """
+        Return the :class:`StatResult` for this path, from the
+        central directory (cached on a read-only root).
+
+        >>> zf = zipfile.ZipFile(io.BytesIO(), 'w')
+        >>> zf.writestr('b/c.txt', 'content of c')
+        >>> info = Path(zf, 'b/c.txt').stat()
+        >>> info.st_size, oct(info.st_mode)
+        (12, '0o100600')
+        >>> stat.S_ISDIR(Path(zf, 'b/').stat().st_mode)
+        True
+        """
+        if self.at and not self.exists():
+            raise FileNotFoundError(self)
+        return self.root._stat(self.at)
+
+    def iter_chunks(self, size=io.DEFAULT_BUFFER_SIZE, *, buffer=None):
+        """
+        Iterate over the contents in chunks of at most ``size`` bytes,
+        in constant memory.
+
+        Given a writable ``buffer``, read each chunk into it instead,
+        yielding a :class:`memoryview` of the part filled (valid only
+        until the next chunk is read); its length supersedes ``size``.
+
+        For a member stored without compression in a read-only archive
+        on disk, the chunks are copied from a memory map of the archive,
+        checking the CRC as they are.
+        """
+        if self.is_dir():
+            raise IsADirectoryError(self)
+        if not self.exists():
+            raise FileNotFoundError(self)
+        return self._iter_chunks(size, buffer)
+
+    def _iter_chunks(self, size, buffer):
+        target = None if buffer is None else memoryview(buffer).cast('B')
+        if target is not None:
+            size = len(target)
+        view = self.root._data_view(self.at)
+        if view is None:
+            with self.open('rb') as strm:
+                if target is None:
+                    yield from iter(functools.partial(strm.read, size), b'')
+                    return
+                while count := strm.readinto(target):
+                    yield target[:count]
+            return
+        crc = 0
+        for pos in range(0, len(view), size):
+            chunk = view[pos : pos + size]
+            crc = binascii.crc32(chunk, crc)
+            if target is None:
+                yield bytes(chunk)
+                continue
+            target[: len(chunk)] = chunk
+            yield target[: len(chunk)]
+        if crc != self.root.getinfo(self.at).CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {self.at!r}")
+
+    def read_many(self, paths_or_pattern, order='offset'):
+        """
+        Read the contents of many files, yielding ``(path, bytes)``
+        for each.
+
+        ``paths_or_pattern`` is a glob pattern relative to this path
+        (whose matching files are read) or an iterable of paths on
+        this root or names relative to this path.
+
+        The files are read in the order they are stored in the archive
+        and, for an archive opened read-only from a filename, through a
+        separate handle with a large buffer, so the reads are sequential.
+        With ``order='offset'``, each is yielded as it's read; with
+        ``order='request'``, they are yielded in the order requested,
+        holding any read ahead of their turn.
+        """
+        if order not in ('offset', 'request'):
+            raise ValueError(f"Unsupported order: {order!r}")
+        if isinstance(paths_or_pattern, str):
+            paths = [path for path in self.glob(paths_or_pattern) if path.is_file()]
+        else:
+            paths = [
+                path if isinstance(path, Path) else self.joinpath(path)
+                for path in paths_or_pattern
+            ]
+        for path in paths:
+            if path.root is not self.root:
+                raise ValueError(f"{path} is not in {self.root.filename}")
+            if path.is_dir():
+                raise IsADirectoryError(path)
+            if not path.exists():
+                raise FileNotFoundError(path)
+        infos = [self.root.getinfo(path.at) for path in paths]
+        by_offset = sorted(range(len(paths)), key=lambda n: infos[n].header_offset)
+        return self._read_many(paths, infos, by_offset, order == 'request')
+
+    def _read_many(self, paths, infos, by_offset, in_request_order):
+        ahead = {}
+        turn = 0
+        with self.root._sequential() as handle:
+            for index in by_offset:
+                with handle.open(infos[index]) as strm:
+                    data = strm.read()
+                if not in_request_order:
+                    yield paths[index], data
+                    continue
+                ahead[index] = data
+                while turn in ahead:
+                    yield paths[turn], ahead.pop(turn)
+                    turn += 1
 
     def _next(self, at):
         return self.__class__(self.root, at)
@@ -391,7 +981,7 @@ class Path:
         return not self.at or self.at.endswith("/")
 
     def is_file(self):
-        return self.exists() and not self.is_dir()
+        return bool(self.root._name_set().kind(self.at) & _FILE)
 
     def exists(self):
         return self.at in self.root._name_set()
@@ -399,31 +989,211 @@ class Path:
     def iterdir(self):
         if not self.is_dir():
             raise ValueError("Can't listdir a file")
-        subs = map(self._next, self.root.namelist())
-        return filter(self._is_child, subs)
+        return map(self._next, self.root._children(self.at))
+
+    def walk(self, top_down=True):
+        """
+        Walk the directory tree from this path, yielding a tuple of
+        ``(dirpath, dirnames, filenames)`` for each directory, as
+        :meth:`pathlib.Path.walk` does.
+
+        The directories are resolved from one pass over the names.
+        When walking top-down, the caller may modify ``dirnames`` in
+        place to prune (or reorder) the directories visited.
+        """
+        if not self.is_dir() or self.at and not self.exists():
+            return
+        tree = self.root._tree()
+        paths = [self]
+        while paths:
+            path = paths.pop()
+            if isinstance(path, tuple):
+                yield path
+                continue
+            dirs = {}
+            filenames = []
+            for name in tree.get(path.at.rstrip('/'), []):
+                base = posixpath.basename(name.rstrip('/'))
+                if name.endswith('/'):
+                    dirs[base] = name
+                else:
+                    filenames.append(base)
+            dirnames = list(dirs)
+            if top_down:
+                yield path, dirnames, filenames
+            else:
+                paths.append((path, dirnames, filenames))
+            paths += [
+                self._next(dirs[name]) for name in reversed(dirnames) if name in dirs
+            ]
 
     def match(self, path_pattern):
+        import pathlib
+
         return pathlib.PurePosixPath(self.at).match(path_pattern)
 
     def is_symlink(self):
         """
         Return whether this path is a symlink.
         """
-        info = self.root.getinfo(self.at)
-        mode = info.external_attr >> 16
-        return stat.S_ISLNK(mode)
+        return self.root._name_set().kind(self.at) == _SYMLINK
+
+    def glob(self, pattern, *, max_depth=None, kind=None):
+        """
+        Iterate over the paths matching pattern.
 
-    def glob(self, pattern):
+        Pass ``max_depth`` to match only paths at most that many levels
+        beneath this one, found by descending the directory index level
+        by level (and yielded in that order) rather than scanning every
+        name. Pass ``kind``, either 'file' or 'dir', to match only
+        paths of that kind.
+        """
         if not pattern:
             raise ValueError(f"Unacceptable pattern: {pattern!r}")
+        if kind not in (None, 'file', 'dir'):
+            raise ValueError(f"Unknown kind: {kind!r}")
+
+        from .glob import compile_lines, compile_pattern, literal_prefix, names_blob
+
+        prefix = self.at + literal_prefix(pattern)
+        finder = compile_lines(pattern, '/', self.at, kind)
+        if max_depth is None:
+            candidates = None
+            blob = finder and self.root._names_blob(prefix)
+        else:
+            candidates = self._descendants(max_depth, prefix)
+            blob = finder and names_blob(candidates)
+        if blob is not None:
+            resolve = self.root._name_set().resolve
+            return map(self._next, map(resolve, finder.findall(blob)))
+        if candidates is None:
+            candidates = self.root._names_with_prefix(prefix)
+        matches = compile_pattern(pattern, '/', self.at, kind).fullmatch
+        return map(self._next, filter(matches, candidates))
+
+    def _descendants(self, max_depth, prefix):
+        """
+        Return the names beginning with prefix at most max_depth levels
+        beneath this directory (starting with its own), level by level,
+        descending only into directories that may contain such names.
+        """
+        tree = self.root._tree()
+        own = self.at in self.root._name_set() and self.at.startswith(prefix)
+        names = [self.at] if own else []
+        level = [self.at]
+        for _ in range(max_depth):
+            children = [
+                child for parent in level for child in tree.get(parent.rstrip('/'), [])
+            ]
+            names += [name for name in children if name.startswith(prefix)]
+            level = _dedupe(
+                name
+                for name in children
+                if name.endswith('/')
+                and (name.startswith(prefix) or prefix.startswith(name))
+            )
+        return names
+
+    def rglob(self, pattern, *, max_depth=None, kind=None):
+        return self.glob(f'**/{pattern}', max_depth=max_depth, kind=kind)
+
+    def glob_many(self, patterns):
+        """
+        Iterate over ``(pattern, path)`` for each path matching any of
+        patterns, matching them all in one pass over the names.
 
-        prefix = re.escape(self.at)
-        tr = Translator(seps='/')
-        matches = re.compile(prefix + tr.translate(pattern)).fullmatch
-        return map(self._next, filter(matches, self.root.namelist()))
-
-    def rglob(self, pattern):
-        return self.glob(f'**/{pattern}')
+        Paths are yielded in namelist order, each once for every
+        pattern it matches, in the order of patterns.
+        """
+        patterns = tuple(patterns)
+        if not all(patterns):
+            raise ValueError(f"Unacceptable pattern in {patterns!r}")
+        if not patterns:
+            return iter(())
+
+        from .glob import compile_many, compile_pattern, literal_prefix
+
+        prefixes = [self.at + literal_prefix(pattern) for pattern in patterns]
+        prefix = posixpath.commonprefix(prefixes)
+        finder = compile_many(patterns, '/', self.at)
+        blob = finder and self.root._names_blob(prefix)
+        if blob is not None:
+            resolve = self.root._name_set().resolve
+            hits = (
+                (resolve(match.group()[1:]), match.lastindex - 1)
+                for match in finder.finditer(blob)
+            )
+        else:
+            names = self.root._names_with_prefix(prefix)
+            hits = zip(names, itertools.repeat(None))
+        matchers = [
+            compile_pattern(pattern, '/', self.at).fullmatch for pattern in patterns
+        ]
+        return self._tag(patterns, matchers, hits)
+
+    def _tag(self, patterns, matchers, hits):
+        """
+        Given names, each with the index of the first pattern it is
+        known to match (or None), yield each pattern a name matches
+        with its path.
+        """
+        for name, first in hits:
+            start = 0 if first is None else first + 1
+            tags = [
+                pattern
+                for pattern, matches in zip(patterns[start:], matchers[start:])
+                if matches(name)
+            ]
+            if first is not None:
+                tags.insert(0, patterns[first])
+            if tags:
+                yield from zip(tags, itertools.repeat(self._next(name)))
+
+    def extract_tree(self, dest, workers=None, executor=None):
+        """
+        Extract this path and everything beneath it into dest, at their
+        full names in the archive (as :meth:`zipfile.ZipFile.extractall`
+        would), returning the paths written.
+
+        The members are divided into ``workers`` contiguous batches
+        (one per CPU by default), each extracted by ``executor`` (a
+        thread pool by default) through its own handle on the archive,
+        streaming the data to bound memory. Handles for a thread pool
+        share the parsed members; any other executor re-opens the
+        archive by filename. Archives not opened read-only from a
+        filename are extracted serially. The paths are returned in
+        the order of the names in the archive.
+        """
+        if self.is_dir():
+            names = self.root._names_with_prefix(self.at)
+        elif self.exists():
+            names = [self.at]
+        else:
+            raise FileNotFoundError(self)
+        dest = os.fspath(dest)
+        if self.root.mode != 'r' or not self.root._reopenable():
+            return [self.root.extract(name, dest) for name in names]
+        import concurrent.futures
+
+        count = workers or os.cpu_count() or 1
+        with contextlib.ExitStack() as stack:
+            if executor is None:
+                executor = stack.enter_context(
+                    concurrent.futures.ThreadPoolExecutor(count)
+                )
+            if isinstance(executor, concurrent.futures.ThreadPoolExecutor):
+                # a clone is a plain ZipFile, so resolve implied dirs here
+                opener = self.root._clone
+                members = list(map(self.root.getinfo, names))
+            else:
+                opener = functools.partial(FastLookup, self.root.filename)
+                members = list(names)
+            size = -(-len(members) // count) or 1
+            futures = [
+                executor.submit(_extract, opener, members[start : start + size], dest)
+                for start in range(0, len(members), size)
+            ]
+            return list(itertools.chain.from_iterable(f.result() for f in futures))
 
     def relative_to(self, other, *extra):
         return posixpath.relpath(str(self), str(other.joinpath(*extra)))
@@ -435,6 +1205,9 @@ class Path:
     def __repr__(self):
         return self.__repr.format(self=self)
 
+    def __reduce__(self):
+        return self.__class__, (self.root, self.at)
+
     def joinpath(self, *other):
         next = posixpath.join(self.at, *other)
         return self._next(self.root.resolve_dir(next))
@@ -448,4 +1221,4 @@ class Path:
         parent_at = posixpath.dirname(self.at.rstrip('/'))
         if parent_at:
             parent_at += '/'
-        return self._next(parent_at)
+        return self._next(self.root.resolve_dir(parent_at))
@@ -0,0 +1,176 @@
+"""
+An asyncio interface for :class:`zipp.Path`.
+
+>>> async def first_line(filename):
+...     root = await AsyncPath.load(filename)
+...     async for path in root.glob('*.txt'):
+...         text = await path.read_text(encoding='utf-8')
+...         return text.splitlines()[0]
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import io
+
+from . import Path
+
+
+@functools.cache
+def _default_executor():
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=8, thread_name_prefix='zipp'
+    )
+
+
+def _materialize(func, *args):
+    return list(func(*args))
+
+
+def _indexed(source, at):
+    """
+    Construct the Path for source and at, building its root's name
+    indexes.
+    """
+    path = source if isinstance(source, Path) else Path(source, at)
+    path.root._name_set()
+    path.root._tree()
+    return path
+
+
+class AsyncPath:
+    """
+    Wrap a :class:`zipp.Path` (or the arguments to construct one),
+    running blocking reads and decompression in an executor.
+
+    Constructing an AsyncPath from a filename parses the archive on
+    the calling thread, and the first lookup by name builds the root's
+    name indexes there; use :meth:`load` to do both in the executor.
+
+    The executor bounds the concurrency; by default, it's a thread pool
+    of eight workers shared by all AsyncPaths. Paths derived from an
+    AsyncPath share its executor and its root, including the root's
+    name indexes (and thus those of any synchronous Path on that root).
+
+    Operations answered directly from the name indexes are synchronous.
+    """
+
+    __slots__ = ('executor', 'path')
+
+    def __init__(self, path, at='', *, executor=None):
+        self.path = path if isinstance(path, Path) else Path(path, at)
+        self.executor = executor or _default_executor()
+
+    @classmethod
+    async def load(cls, source, at='', *, executor=None):
+        """
+        Construct an AsyncPath for source (as accepted by
+        :class:`zipp.Path`), parsing the archive and building its name
+        indexes in the executor.
+        """
+        executor = executor or _default_executor()
+        loop = asyncio.get_running_loop()
+        path = await loop.run_in_executor(executor, _indexed, source, at)
+        return cls(path, executor=executor)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.path!r})'
+
+    def __eq__(self, other):
+        if self.__class__ is not other.__class__:
+            return NotImplemented
+        return self.path == other.path
+
+    def __hash__(self):
+        return hash(self.path)
+
+    def _next(self, path):
+        return self.__class__(path, executor=self.executor)
+
+    def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self.executor, func, *args)
+
+    @property
+    def root(self):
+        return self.path.root
+
+    @property
+    def at(self):
+        return self.path.at
+
+    @property
+    def name(self):
+        return self.path.name
+
+    @property
+    def suffix(self):
+        return self.path.suffix
+
+    @property
+    def suffixes(self):
+        return self.path.suffixes
+
+    @property
+    def stem(self):
+        return self.path.stem
+
+    @property
+    def parent(self):
+        return self._next(self.path.parent)
+
+    def joinpath(self, *other):
+        return self._next(self.path.joinpath(*other))
+
+    __truediv__ = joinpath
+
+    def is_dir(self):
+        return self.path.is_dir()
+
+    def is_file(self):
+        return self.path.is_file()
+
+    def exists(self):
+        return self.path.exists()
+
+    def stat(self):
+        return self.path.stat()
+
+    def __str__(self):
+        return str(self.path)
+
+    async def iterdir(self):
+        for path in await self._run(_materialize, self.path.iterdir):
+            yield self._next(path)
+
+    async def glob(self, pattern, *, max_depth=None, kind=None):
+        glob = functools.partial(
+            self.path.glob, pattern, max_depth=max_depth, kind=kind
+        )
+        for path in await self._run(_materialize, glob):
+            yield self._next(path)
+
+    async def rglob(self, pattern, *, max_depth=None, kind=None):
+        rglob = functools.partial(
+            self.path.rglob, pattern, max_depth=max_depth, kind=kind
+        )
+        for path in await self._run(_materialize, rglob):
+            yield self._next(path)
+
+    async def read_bytes(self):
+        return await self._run(self.path.read_bytes)
+
+    async def read_text(self, *args, **kwargs):
+        read = functools.partial(self.path.read_text, *args, **kwargs)
+        return await self._run(read)
+
+    async def iter_chunks(self, size=io.DEFAULT_BUFFER_SIZE):
+        """
+        Iterate over the contents in chunks of (at most) size bytes.
+        """
+        strm = await self._run(self.path.open, 'rb')
+        try:
+            while chunk := await self._run(strm.read, size):
+                yield chunk
+        finally:
+            await self._run(strm.close)
@@ -0,0 +1,70 @@
+"""
+A cache of decompressed member contents.
+
+Reading a compressed member decompresses it anew each time. For small
+members read repeatedly, attach a cache to the root to keep their
+contents, to be served by :meth:`zipp.Path.read_bytes` and
+:meth:`zipp.Path.read_text`:
+
+>>> root = zipp.Path(filename)  # doctest: +SKIP
+>>> root.root.content_cache = ContentCache(maxsize=2**20)  # doctest: +SKIP
+
+Contents are keyed on the member's name, local header offset, and CRC,
+so a member rewritten in a writable archive is not served stale.
+"""
+
+import collections
+import threading
+
+
+class ContentCache:
+    """
+    A least-recently-used cache of member contents, bounded by their
+    total size in bytes. Contents larger than ``max_item`` (by default,
+    an eighth of ``maxsize``) are not cached.
+    """
+
+    def __init__(self, maxsize=2**24, max_item=None):
+        self.maxsize = maxsize
+        self.max_item = maxsize // 8 if max_item is None else max_item
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._contents = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return the contents for key, or None if not cached.
+        """
+        with self._lock:
+            try:
+                self._contents.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._contents[key]
+
+    def put(self, key, data):
+        """
+        Cache data for key, evicting the least-recently-used contents
+        to stay within maxsize.
+        """
+        if len(data) > min(self.max_item, self.maxsize):
+            return
+        with self._lock:
+            previous = self._contents.pop(key, b'')
+            self.size += len(data) - len(previous)
+            self._contents[key] = data
+            while self.size > self.maxsize:
+                _, evicted = self._contents.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._contents.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._contents)
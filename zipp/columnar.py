@@ -0,0 +1,297 @@
+"""
+A compact, lazily materialized index of an archive's central directory.
+
+:class:`zipfile.ZipFile` constructs a :class:`zipfile.ZipInfo` for
+every member when it opens an archive. For archives with millions of
+members, those objects dominate the memory (and much of the time) spent
+before any member is read. :class:`ColumnarLookup` instead retains the
+raw central directory as one blob, with the position of each record and
+each member's header offset in arrays, and the member names (which the
+:class:`zipp.Path` indexes need regardless). A ``ZipInfo`` is
+constructed only when a member is accessed:
+
+>>> path = zipp.Path(ColumnarLookup(filename))  # doctest: +SKIP
+"""
+
+import array
+import binascii
+import bisect
+import collections.abc
+import functools
+import os
+import struct
+import zipfile
+
+from . import FastLookup, StatResult
+
+_central_dir = struct.Struct('<4s4B4HL2L5H2L')
+"""The fixed fields of a central directory record (``structCentralDir``)."""
+
+_MASK = 0xFFFFFFFF
+"""Marks a field whose value is in the Zip64 extra field."""
+
+
+class _Members(collections.abc.Sequence):
+    """
+    The members of a ColumnarLookup (its ``filelist``), materialized
+    on access.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def __len__(self):
+        return len(self.root._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.root._info(pos) for pos in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.root._info(index)
+
+
+class _NameToInfo(collections.abc.Mapping):
+    """
+    The members of a ColumnarLookup by name (its ``NameToInfo``),
+    materialized on access.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def __getitem__(self, name):
+        return self.root._info(self.root._positions[name])
+
+    def __contains__(self, name):
+        return name in self.root._positions
+
+    def __iter__(self):
+        return iter(self.root._positions)
+
+    def __len__(self):
+        return len(self.root._positions)
+
+
+def _sanitary(name):
+    """
+    Whether name is unchanged by the sanitization in ZipInfo.
+    """
+    return '\x00' not in name and (os.sep == '/' or os.sep not in name)
+
+
+class ColumnarLookup(FastLookup):
+    """
+    Read-only FastLookup that parses the central directory into
+    columns and constructs each member's ZipInfo only on access.
+
+    Members relying on the extra field for their sizes, offset, or
+    name (Zip64 or Info-ZIP Unicode Path) are materialized as they
+    are parsed. Errors in the extra field of any other member are
+    only reported when that member is accessed.
+
+    The ``filelist`` and ``NameToInfo`` attributes are internal views,
+    materializing members on access, rather than the list and dict of
+    a ZipFile; use :meth:`infolist` and :meth:`getinfo` instead.
+    """
+
+    def infolist(self):
+        """
+        Return a list of the members, materializing each.
+        """
+        return list(self.filelist)
+
+    def _RealGetContents(self):
+        if self.mode != 'r':
+            raise ValueError(f"{self.__class__.__name__} supports only mode 'r'")
+        try:
+            endrec = zipfile._EndRecData(self.fp)
+        except OSError:
+            raise zipfile.BadZipFile("File is not a zip file")
+        if not endrec:
+            raise zipfile.BadZipFile("File is not a zip file")
+        signature, size_cd, offset_cd = endrec[0], endrec[5], endrec[6]
+        self._comment = endrec[8]
+        # "concat" is zero, unless zip was concatenated to another file
+        concat = endrec[9] - size_cd - offset_cd
+        if signature == zipfile.stringEndArchive64:
+            concat -= zipfile.sizeEndCentDir64 + zipfile.sizeEndCentDir64Locator
+        self.start_dir = offset_cd + concat
+        if self.start_dir < 0:
+            raise zipfile.BadZipFile("Bad offset for central directory")
+        self.fp.seek(self.start_dir)
+        self._directory = self.fp.read(size_cd)
+        self._concat = concat
+        self._parse()
+        self.filelist = _Members(self)
+        self.NameToInfo = _NameToInfo(self)
+
+    def _parse(self):
+        data = self._directory
+        records = self._records = array.array('Q')
+        offsets = self._offsets = array.array('Q')
+        attrs = self._attrs = array.array('L')
+        names = self._names_column = []
+        self._materialized = {}
+        eager = {}
+        encoding = getattr(self, 'metadata_encoding', None) or 'cp437'
+        pos = 0
+        while pos < len(data):
+            if pos + _central_dir.size > len(data):
+                raise zipfile.BadZipFile("Truncated central directory")
+            fields = _central_dir.unpack_from(data, pos)
+            if fields[0] != zipfile.stringCentralDir:
+                raise zipfile.BadZipFile("Bad magic number for central directory")
+            if fields[3] > zipfile.MAX_EXTRACT_VERSION:
+                raise NotImplementedError(f"zip file version {fields[3] / 10:.1f}")
+            name_start = pos + _central_dir.size
+            extra_start = name_start + fields[12]
+            extra_end = extra_start + fields[13]
+            name = data[name_start:extra_start].decode(
+                'utf-8' if fields[5] & 0x800 else encoding
+            )
+            offset, attr = fields[18] + self._concat, fields[17]
+            records.append(pos)
+            if (
+                _MASK in (fields[10], fields[11], fields[18])
+                or b'up' in data[extra_start:extra_end]
+                or not _sanitary(name)
+            ):
+                info = eager[len(names)] = self._materialize(pos)
+                name, offset = info.filename, info.header_offset
+            names.append(name)
+            offsets.append(offset)
+            attrs.append(attr)
+            pos = extra_end + fields[14]
+        self._positions = {name: index for index, name in enumerate(names)}
+        self._eager = array.array('Q', eager)
+        for index, info in eager.items():
+            self._materialized[index] = self._bound(index, info)
+
+    def _materialize(self, pos):
+        """
+        Construct the ZipInfo for the record at pos in the central
+        directory, as ZipFile does.
+        """
+        data = self._directory
+        fields = _central_dir.unpack_from(data, pos)
+        name_start = pos + _central_dir.size
+        extra_start = name_start + fields[12]
+        extra_end = extra_start + fields[13]
+        raw_name = bytes(data[name_start:extra_start])
+        encoding = getattr(self, 'metadata_encoding', None) or 'cp437'
+        info = zipfile.ZipInfo(
+            raw_name.decode('utf-8' if fields[5] & 0x800 else encoding)
+        )
+        info.extra = bytes(data[extra_start:extra_end])
+        info.comment = bytes(data[extra_end : extra_end + fields[14]])
+        (
+            info.create_version,
+            info.create_system,
+            info.extract_version,
+            info.reserved,
+            info.flag_bits,
+            info.compress_type,
+            time,
+            date,
+            info.CRC,
+            info.compress_size,
+            info.file_size,
+        ) = fields[1:12]
+        info.volume, info.internal_attr, info.external_attr = fields[15:18]
+        info._raw_time = time
+        info.date_time = _date_time(date, time)
+        info.header_offset = fields[18]
+        _decode_extra(info, raw_name)
+        info.header_offset += self._concat
+        return info
+
+    def _info(self, index):
+        try:
+            return self._materialized[index]
+        except KeyError:
+            pass
+        info = self._bound(index, self._materialize(self._records[index]))
+        return self._materialized.setdefault(index, info)
+
+    def _bound(self, index, info):
+        """
+        Bound the member by the next, as ZipFile does (where supported)
+        to detect overlapping entries. Of members sharing an offset,
+        only the first is bounded by the next member.
+        """
+        if not hasattr(zipfile.ZipInfo, '_end_offset'):  # pragma: no cover
+            return info
+        offset = self._offsets[index]
+        ordered = self._sorted_offsets
+        following = bisect.bisect_right(ordered, offset)
+        shared = following - bisect.bisect_left(ordered, offset) > 1
+        if shared and _first(self._offsets, offset) != index:
+            info._end_offset = offset
+        else:
+            info._end_offset = (
+                ordered[following] if following < len(ordered) else self.start_dir
+            )
+        return info
+
+    @functools.cached_property
+    def _sorted_offsets(self):
+        return array.array('Q', sorted(self._offsets))
+
+    def _member_entries(self, members):
+        return zip(self._names_column[members], self._attrs[members])
+
+    def _stat(self, name):
+        """
+        Compute the StatResult for a member not yet materialized
+        from its record.
+        """
+        index = self._positions.get(name)
+        if index is None or index in self._materialized or name in self._stats:
+            return super()._stat(name)
+        fields = _central_dir.unpack_from(self._directory, self._records[index])
+        result = self._stats[name] = StatResult._build(
+            name,
+            fields[17],
+            _date_time(fields[8], fields[7]),
+            fields[11],
+            fields[10],
+            fields[9],
+            fields[6],
+        )
+        return result
+
+
+def _first(values, value):
+    """
+    Return the index of the first occurrence of value in values.
+    """
+    return next(index for index, each in enumerate(values) if each == value)
+
+
+def _date_time(date, time):
+    """
+    Convert the MS-DOS date and time of a record to a ``date_time`` tuple.
+    """
+    return (
+        (date >> 9) + 1980,
+        (date >> 5) & 0xF,
+        date & 0x1F,
+        time >> 11,
+        (time >> 5) & 0x3F,
+        (time & 0x1F) * 2,
+    )
+
+
+def _decode_extra(info, raw_name):
+    """
+    Apply the extra field of info, passing the CRC of its raw name
+    where required (Python 3.12 and later).
+    """
+    decode = info._decodeExtra
+    if decode.__code__.co_argcount > 1:
+        decode(binascii.crc32(raw_name))
+    else:
+        decode()
@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 
@@ -21,15 +22,19 @@ class Translator:
 
     seps: str
 
+    excluded = ''
+    """Regex for characters, other than separators, no wildcard matches."""
+
     def __init__(self, seps: str = _default_seps):
         assert seps and set(seps) <= set(_default_seps), "Invalid separators"
         self.seps = seps
 
-    def translate(self, pattern):
+    def translate(self, pattern, kind=None):
         """
-        Given a glob pattern, produce a regex that matches it.
+        Given a glob pattern, produce a regex that matches it
+        (restricted to names of kind, if given).
         """
-        return self.extend(self.match_dirs(self.translate_core(pattern)))
+        return self.extend(self.match_kind(self.translate_core(pattern), kind))
 
     @legacy_end_marker
     def extend(self, pattern):
@@ -51,6 +56,25 @@ class Translator:
         """
         return rf'{pattern}[/]?'
 
+    def match_kind(self, pattern, kind=None):
+        """
+        Match only names of kind, either 'file' or 'dir', or both if
+        kind is None.
+
+        The kind is asserted on the name's last character, as the
+        pattern (ending in ``**``, say) may itself match a trailing slash.
+
+        >>> t = Translator('/')
+        >>> [t.match_kind('b', kind) for kind in (None, 'file', 'dir')]
+        ['b[/]?', '(?:b)(?<!/)', 'b[/]?(?<=/)']
+        """
+        if kind is None:
+            return self.match_dirs(pattern)
+        return {
+            'file': f'(?:{pattern})(?<!/)',
+            'dir': f'{self.match_dirs(pattern)}(?<=/)',
+        }[kind]
+
     def translate_core(self, pattern):
         r"""
         Given a glob pattern, produce a regex that matches it.
@@ -73,8 +97,8 @@ class Translator:
         return match.group('set') or (
             re.escape(match.group(0))
             .replace('\\*\\*', r'.*')
-            .replace('\\*', rf'[^{re.escape(self.seps)}]*')
-            .replace('\\?', r'[^/]')
+            .replace('\\*', rf'[^{re.escape(self.seps)}{self.excluded}]*')
+            .replace('\\?', rf'[^/{self.excluded}]')
         )
 
     def restrict_rglob(self, pattern):
@@ -104,6 +128,131 @@ class Translator:
         return re.sub(not_seps_pattern, handle_segment, pattern)
 
 
+class LineTranslator(Translator):
+    r"""
+    Translate glob patterns to find the matching names in a blob of
+    names, each preceded and followed by a newline.
+
+    >>> print(LineTranslator('/').translate('*.txt'))
+    \n([^/\n]*\.txt[/]?)(?=\n)
+    """
+
+    excluded = r'\n'
+
+    def extend(self, pattern):
+        r"""
+        Capture the name, consuming the newline before it but not the
+        one after, so that adjacent names both match.
+        """
+        return rf'\n({pattern})(?=\n)'
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern, seps=_default_seps, prefix='', kind=None):
+    """
+    Compile a glob pattern, to be matched beneath the literal prefix,
+    into a regex (matching only names of kind, if given).
+
+    Results are cached; inspect with ``compile_pattern.cache_info()``
+    and reset with ``compile_pattern.cache_clear()``.
+
+    >>> compile_pattern('*.txt', '/', 'b/').fullmatch('b/c.txt')
+    <re.Match object; span=(0, 7), match='b/c.txt'>
+    >>> compile_pattern('*.txt', '/', 'b/') is compile_pattern('*.txt', '/', 'b/')
+    True
+    """
+    return re.compile(re.escape(prefix) + Translator(seps).translate(pattern, kind))
+
+
+@functools.lru_cache(maxsize=256)
+def compile_lines(pattern, seps=_default_seps, prefix='', kind=None):
+    r"""
+    Compile a glob pattern, to be matched beneath the literal prefix,
+    into a regex finding all matching names (of kind, if given) in a
+    blob of names at once (see :func:`names_blob`).
+
+    Return None if the pattern may match a newline, which no longer
+    separates names.
+
+    >>> blob = names_blob(['a.txt', 'b/', 'b/c.txt'])
+    >>> compile_lines('*.txt', '/', 'b/').findall(blob)
+    ['b/c.txt']
+    >>> compile_lines('*', '/', kind='dir').findall(blob)
+    ['b/']
+    >>> compile_lines('[^a].txt', '/') is None
+    True
+    """
+    core = _line_core(pattern, seps, prefix, kind)
+    return core and re.compile(LineTranslator(seps).extend(core))
+
+
+@functools.lru_cache(maxsize=256)
+def compile_many(patterns, seps=_default_seps, prefix=''):
+    r"""
+    Compile a tuple of glob patterns, to be matched beneath the literal
+    prefix, into one regex finding the names matching any of them in a
+    blob of names, capturing each in the group numbered for the first
+    pattern it matches (its ``lastindex``).
+
+    Return None if any pattern may match a newline.
+
+    >>> blob = names_blob(['a.txt', 'b/', 'b/c.py'])
+    >>> finder = compile_many(('*.py', '*.txt', 'b'), '/')
+    >>> [match.lastindex for match in finder.finditer(blob)]
+    [2, 3]
+    """
+    cores = [_line_core(pattern, seps, prefix) for pattern in patterns]
+    if not all(cores):
+        return None
+    alternatives = '|'.join(f'({core})' for core in cores)
+    return re.compile(rf'\n(?:{alternatives})(?=\n)')
+
+
+def _line_core(pattern, seps, prefix, kind=None):
+    """
+    Translate pattern beneath prefix for :class:`LineTranslator`,
+    without the extension, or return None if it may match a newline.
+    """
+    sets = filter(None, (match.group('set') for match in separate(pattern)))
+    if any(re.fullmatch(set_, '\n') for set_ in sets):
+        return None
+    translator = LineTranslator(seps)
+    core = translator.translate_core(pattern)
+    return re.escape(prefix) + translator.match_kind(core, kind)
+
+
+def names_blob(names):
+    r"""
+    Join names into one string to be searched by :func:`compile_lines`,
+    or return None if any name contains a newline.
+
+    >>> names_blob(['a.txt', 'b/'])
+    '\na.txt\nb/\n'
+    >>> names_blob(['a\nb']) is None
+    True
+    """
+    blob = '\n'.join(['', *names, ''])
+    return blob if blob.count('\n') == len(names) + 1 else None
+
+
+def literal_prefix(pattern):
+    """
+    Return the leading portion of pattern that contains no wildcards.
+
+    Any name matched by the pattern must begin with this prefix.
+
+    >>> literal_prefix('pkg/sub/*.py')
+    'pkg/sub/'
+    >>> literal_prefix('b/c.*')
+    'b/c.'
+    >>> literal_prefix('j/?.b[ai][nz]')
+    'j/'
+    >>> literal_prefix('**/*.txt')
+    ''
+    """
+    return re.split(r'[*?\[]', pattern, maxsplit=1)[0]
+
+
 def separate(pattern):
     """
     Separate out character sets to avoid translating their contents.
@@ -0,0 +1,118 @@
+"""
+A process-wide registry of parsed archives.
+
+Constructing a :class:`zipp.Path` from a filename opens the archive and
+reads its central directory anew each time. Resolve the root through
+the registry instead to share one parsed archive (and its name indexes)
+among all callers in the process:
+
+>>> path = zipp.Path(lookup(filename))  # doctest: +SKIP
+
+Entries are keyed on the archive's resolved path and its modification
+time, size, and inode, so an archive replaced on disk is parsed afresh.
+
+Roots from the process-wide registry pickle as that key, so Paths sent
+to other processes (such as the workers of a process pool) are resolved
+against the registry of the receiving process, parsing each archive
+there once rather than with each Path. Roots from any other registry
+pickle as a :class:`zipp.FastLookup` would, re-opening the archive.
+"""
+
+import collections
+import os
+import threading
+
+from . import FastLookup
+
+
+class RegisteredLookup(FastLookup):
+    """
+    A root held by a registry. If that's the process-wide registry,
+    it's pickled by the identity (key) of its archive.
+    """
+
+    key = None
+    registry = None
+
+    def __reduce_ex__(self, protocol):
+        if self.registry is not _inst:
+            return super().__reduce_ex__(protocol)
+        return _restore, (self.key,)
+
+
+def _restore(key):
+    """
+    Resolve the root for the archive identified by key from the
+    process-wide registry, unless the archive has changed.
+    """
+    root = lookup(key[0])
+    if root.key != key:
+        raise ValueError(f"Archive {key[0]!r} changed since pickled")
+    return root
+
+
+class Registry:
+    """
+    A bounded, least-recently-used cache of :class:`RegisteredLookup`
+    roots for archives on disk.
+
+    Roots evicted or invalidated are not closed, as paths may still
+    refer to them; they close when no longer referenced.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._roots = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(filename):
+        path = os.path.realpath(filename)
+        info = os.stat(path)
+        return path, info.st_mtime_ns, info.st_size, info.st_ino
+
+    def lookup(self, filename):
+        """
+        Return the root for the archive at filename, parsing it
+        only if it has not been seen or has changed.
+        """
+        key = self._key(filename)
+        with self._lock:
+            if key in self._roots:
+                self._roots.move_to_end(key)
+                return self._roots[key]
+        root = RegisteredLookup(key[0])
+        root.key = key
+        root.registry = self
+        with self._lock:
+            if key not in self._roots:
+                self._discard(key[0])
+                self._roots[key] = root
+            self._roots.move_to_end(key)
+            root = self._roots[key]
+            while len(self._roots) > self.maxsize:
+                self._roots.popitem(last=False)
+        return root
+
+    def invalidate(self, filename=None):
+        """
+        Forget the root for the archive at filename, or all roots
+        if no filename is given.
+        """
+        with self._lock:
+            if filename is None:
+                self._roots.clear()
+            else:
+                self._discard(os.path.realpath(filename))
+
+    def _discard(self, path):
+        for key in [key for key in self._roots if key[0] == path]:
+            del self._roots[key]
+
+    def __len__(self):
+        return len(self._roots)
+
+
+_inst = Registry()
+lookup = _inst.lookup
+invalidate = _inst.invalidate
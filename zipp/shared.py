@@ -0,0 +1,380 @@
+"""
+Share a parsed archive among processes through shared memory.
+
+Each process reading an archive otherwise opens it and parses its
+central directory for itself. Instead, publish the raw central
+directory with the columns :class:`zipp.columnar.ColumnarLookup`
+indexes it by (and optionally the archive's bytes, as for an archive in
+memory) to :mod:`multiprocessing.shared_memory`:
+
+>>> with SharedArchive(zipp.Path(filename).root) as shared:  # doctest: +SKIP
+...     pool.map(work, itertools.repeat(shared.name, count))
+
+and attach each worker to it, read-only:
+
+>>> root = zipp.Path(attach(name))  # doctest: +SKIP
+
+An attached root reads its columns in place, through views of the
+shared memory, so attaching costs a worker the same small amount of
+memory however many members the archive has. Members are constructed
+(and names indexed) only as the worker uses them.
+
+Roots attached to a shared archive pickle by its name, so Paths sent to
+a worker resolve against the one root attached in that worker.
+"""
+
+import array
+import bisect
+import collections.abc
+import contextlib
+import functools
+import io
+import itertools
+import json
+import struct
+from multiprocessing import shared_memory
+
+from . import FastLookup, _release
+from .columnar import ColumnarLookup, _Members, _NameToInfo
+
+_sections = (
+    'meta',
+    'directory',
+    'records',
+    'offsets',
+    'attrs',
+    'bounds',
+    'names',
+    'order',
+    'sorted_offsets',
+    'eager',
+    'data',
+)
+"""
+The sections of a shared archive, in order: a JSON object of the
+archive's scalars, the raw central directory, the arrays (of unsigned
+64-bit integers) of the columns, the names encoded as UTF-8 and
+delimited by ``bounds``, the index of each name in sorted order, the
+header offsets in sorted order, the members to materialize on attach,
+and the archive's bytes (if published).
+"""
+
+_header = struct.Struct(f'<8s{len(_sections)}Q')
+"""Magic, then the size of each section."""
+
+_magic = b'zippshm2'
+
+_align = 8
+"""Each section starts at a multiple of this, so arrays can be cast."""
+
+
+def _open(name):
+    """
+    Attach to the shared memory name without tracking it for cleanup
+    (where supported), as the publisher owns it.
+    """
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:  # pragma: no cover
+        return shared_memory.SharedMemory(name)
+
+
+def _column(values):
+    return array.array('Q', values).tobytes()
+
+
+def _layout(columns, contents):
+    """
+    Return the sections publishing the ColumnarLookup columns and the
+    archive's bytes (contents).
+    """
+    names = columns._names_column
+    encoded = [name.encode('utf-8') for name in names]
+    meta = {
+        'filename': columns.filename,
+        'encoding': getattr(columns, 'metadata_encoding', None),
+        'comment': columns.comment.decode('latin-1'),
+        'start_dir': columns.start_dir,
+        'concat': columns._concat,
+        'unique': len(columns._positions),
+    }
+    return {
+        'meta': json.dumps(meta, separators=(',', ':')).encode(),
+        'directory': columns._directory,
+        'records': _column(columns._records),
+        'offsets': _column(columns._offsets),
+        'attrs': _column(columns._attrs),
+        'bounds': _column(itertools.accumulate(map(len, encoded), initial=0)),
+        'names': b''.join(encoded),
+        'order': _column(sorted(range(len(names)), key=names.__getitem__)),
+        'sorted_offsets': _column(columns._sorted_offsets),
+        'eager': _column(columns._eager),
+        'data': contents,
+    }
+
+
+class SharedArchive:
+    """
+    Publish the central directory of root (a finished zipfile,
+    preferably read-only) and, if data is true, the archive's bytes,
+    to shared memory named :attr:`name`.
+
+    By default, the bytes are published only if the archive was not
+    opened from a filename. Otherwise, attached roots read from the
+    archive on disk.
+
+    The publisher owns the shared memory; :meth:`unlink` it (or use
+    the SharedArchive as a context manager) once readers are done.
+    """
+
+    def __init__(self, root, data=None):
+        root = FastLookup.make(root)
+        if data is None:
+            data = not root._reopenable()
+        contents = self._read(root) if data else b''
+        with self._columns(root, contents) as columns:
+            sections = _layout(columns, contents)
+        sizes = [len(sections[section]) for section in _sections]
+        total = _header.size + sum(size + -size % _align for size in sizes)
+        self._shm = shared_memory.SharedMemory(create=True, size=total)
+        buf = self._shm.buf
+        _header.pack_into(buf, 0, _magic, *sizes)
+        start = _header.size
+        for section, size in zip(_sections, sizes):
+            buf[start : start + size] = sections[section]
+            start += size + -size % _align
+        del buf
+
+    @classmethod
+    def _columns(cls, root, contents):
+        """
+        Return a context for the columns of root's archive, parsing
+        them anew unless root is columnar.
+        """
+        if isinstance(root, ColumnarLookup):
+            return contextlib.nullcontext(root)
+        if root._reopenable():
+            return ColumnarLookup(root.filename)
+        return ColumnarLookup(io.BytesIO(contents or cls._read(root)))
+
+    @staticmethod
+    def _read(root):
+        if root._reopenable():
+            with open(root.filename, 'rb') as strm:
+                return strm.read()
+        with root._lock:
+            root.fp.seek(0)
+            return root.fp.read()
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    def close(self):
+        self._shm.close()
+
+    def unlink(self):
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        self.unlink()
+
+
+class _Reader(io.RawIOBase):
+    """
+    A read-only, seekable stream over a buffer.
+    """
+
+    def __init__(self, view):
+        self._view = view
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = max(0, min(len(buffer), len(self._view) - self._pos))
+        buffer[:count] = self._view[self._pos : self._pos + count]
+        self._pos += count
+        return count
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = (0, self._pos, len(self._view))[whence]
+        self._pos = base + offset
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        self._view = b''
+        super().close()
+
+
+class _NameColumn(collections.abc.Sequence):
+    """
+    The names of a shared archive, decoded on access.
+    """
+
+    def __init__(self, blob, bounds):
+        self.blob = blob
+        self.bounds = bounds
+
+    def __len__(self):
+        return len(self.bounds) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[pos] for pos in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return str(self.blob[self.bounds[index] : self.bounds[index + 1]], 'utf-8')
+
+
+class _Positions(collections.abc.Mapping):
+    """
+    The index of each name of a shared archive (the last, for a
+    repeated name), found by bisecting the names in sorted order.
+    """
+
+    def __init__(self, names, order, size):
+        self.names = names
+        self.order = order
+        self.size = size
+
+    def _bounds(self, name):
+        key = self.names.__getitem__
+        return (
+            bisect.bisect_left(self.order, name, key=key),
+            bisect.bisect_right(self.order, name, key=key),
+        )
+
+    def __getitem__(self, name):
+        start, stop = self._bounds(name)
+        if start == stop:
+            raise KeyError(name)
+        return self.order[stop - 1]
+
+    def __iter__(self):
+        for index, name in enumerate(self.names):
+            if self.order[self._bounds(name)[0]] == index:
+                yield name
+
+    def __len__(self):
+        return self.size
+
+
+class SharedLookup(ColumnarLookup):
+    """
+    A read-only root attached to the archive published as name,
+    reading its columns from the shared memory in place.
+
+    Members of an archive whose bytes were published are read from
+    (and viewed by :meth:`zipp.Path.read_buffer` directly in) the
+    shared memory.
+    """
+
+    def __init__(self, name):
+        self._reader = self._data = None
+        self._views = []
+        self._shm = _open(name)
+        try:
+            self._attach(name)
+        except Exception:
+            self.fp = None
+            self._close_views()
+            raise
+        self._data = self._sections['data'] or None
+        filename = self._meta['filename']
+        self._reader = self._data and _Reader(self._data)
+        super().__init__(self._reader or filename)
+        self.filename = filename
+
+    def _attach(self, name):
+        view = self._view(self._shm.buf)
+        magic, *sizes = _header.unpack_from(view)
+        if magic != _magic:
+            raise ValueError(f"{name!r} is not a shared archive")
+        self._sections = {}
+        start = _header.size
+        for section, size in zip(_sections, sizes):
+            self._sections[section] = self._view(view[start : start + size])
+            start += size + -size % _align
+        self._meta = json.loads(bytes(self._sections['meta']))
+
+    def _view(self, view):
+        self._views.append(view)
+        return view
+
+    def _column(self, section):
+        return self._view(self._sections[section].cast('Q'))
+
+    def _RealGetContents(self):
+        meta = self._meta
+        self.metadata_encoding = meta['encoding']
+        self._comment = meta['comment'].encode('latin-1')
+        self.start_dir = meta['start_dir']
+        self._concat = meta['concat']
+        self._directory = self._sections['directory']
+        self._records = self._column('records')
+        self._offsets = self._column('offsets')
+        self._attrs = self._column('attrs')
+        self._names_column = _NameColumn(
+            self._sections['names'], self._column('bounds')
+        )
+        self._positions = _Positions(
+            self._names_column, self._column('order'), meta['unique']
+        )
+        self._sorted_offsets = self._column('sorted_offsets')
+        self._materialized = {}
+        for index in self._column('eager'):
+            self._info(index)
+        self.filelist = _Members(self)
+        self.NameToInfo = _NameToInfo(self)
+
+    @functools.cached_property
+    def _mmap(self):
+        return super()._mmap if self._data is None else self._data
+
+    def __reduce_ex__(self, protocol):
+        return attach, (self._shm.name,)
+
+    def _close_views(self):
+        for view in reversed(self._views):
+            _release(view)
+        self._views.clear()
+        try:
+            self._shm.close()
+        except BufferError:
+            # views of the memory remain; it is released with them
+            pass
+
+    def close(self):
+        super().close()
+        if self._reader:
+            self._reader.close()
+        self._data = None
+        self._close_views()
+
+
+_attached: dict = {}
+
+
+def attach(name):
+    """
+    Return the root attached to the shared archive name, attaching
+    it once in each process.
+    """
+    root = _attached.get(name)
+    if root is None or root.fp is None:
+        root = _attached[name] = SharedLookup(name)
+    return root
@@ -0,0 +1,223 @@
+"""
+A persistent sidecar index of an archive's central directory.
+
+For archives with many members, parsing the central directory and
+computing the implied directories dominates the cost of constructing
+a root. :class:`IndexedLookup` records both in a sidecar file next to
+the archive (``<archive>.zippidx``) so later processes can load the
+members without parsing:
+
+>>> path = zipp.Path(IndexedLookup(filename))  # doctest: +SKIP
+
+The sidecar is only used if the archive's size, modification time, and
+end of central directory record match those recorded; otherwise the
+archive is parsed as usual and the sidecar rewritten.
+"""
+
+import contextlib
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+import zipfile
+
+from . import FastLookup, _Names
+
+VERSION = 1
+
+_fields = (
+    'orig_filename',
+    'header_offset',
+    'create_version',
+    'create_system',
+    'extract_version',
+    'reserved',
+    'flag_bits',
+    'compress_type',
+    'CRC',
+    'compress_size',
+    'file_size',
+    'volume',
+    'internal_attr',
+    'external_attr',
+    '_raw_time',
+    'date_time',
+    'extra',
+    'comment',
+)
+"""ZipInfo attributes recorded for each member."""
+
+
+def _identity(fp):
+    """
+    Characterize the archive open as fp, to validate a sidecar.
+
+    Return None if fp is not a file or not a zipfile.
+    """
+    try:
+        info = os.fstat(fp.fileno())
+        endrec = zipfile._EndRecData(fp)
+    except OSError:
+        return None
+    if not endrec:
+        return None
+    return {
+        'size': info.st_size,
+        'mtime_ns': info.st_mtime_ns,
+        'eocd': hashlib.sha256(repr(endrec).encode()).hexdigest(),
+    }
+
+
+def _encode(value):
+    return value.decode('latin-1') if isinstance(value, bytes) else value
+
+
+def dumps(zf, identity):
+    """
+    Serialize the members and implied dirs of the parsed zipfile zf.
+    """
+    infos = zf.filelist
+    members = {
+        field: [_encode(getattr(info, field)) for info in infos] for field in _fields
+    }
+    state = {
+        'version': VERSION,
+        'archive': identity,
+        'start_dir': zf.start_dir,
+        'comment': _encode(zf.comment),
+        'members': members,
+        'implied': list(zf._implied_dirs([info.filename for info in infos])),
+    }
+    return json.dumps(state, separators=(',', ':')).encode()
+
+
+def loads(data, identity):
+    """
+    Load the state serialized by :func:`dumps`, or None if it does
+    not describe the archive with the given identity.
+    """
+    try:
+        state = json.loads(data)
+    except ValueError:
+        return None
+    if state.get('version') != VERSION or state.get('archive') != identity:
+        return None
+    return state
+
+
+def _infos(members):
+    columns = map(members.__getitem__, _fields)
+    return itertools.starmap(_info, zip(*columns))
+
+
+def _info(
+    orig_filename,
+    header_offset,
+    create_version,
+    create_system,
+    extract_version,
+    reserved,
+    flag_bits,
+    compress_type,
+    CRC,
+    compress_size,
+    file_size,
+    volume,
+    internal_attr,
+    external_attr,
+    raw_time,
+    date_time,
+    extra,
+    comment,
+):
+    info = zipfile.ZipInfo(orig_filename, tuple(date_time))
+    info.header_offset = header_offset
+    info.create_version = create_version
+    info.create_system = create_system
+    info.extract_version = extract_version
+    info.reserved = reserved
+    info.flag_bits = flag_bits
+    info.compress_type = compress_type
+    info.CRC = CRC
+    info.compress_size = compress_size
+    info.file_size = file_size
+    info.volume = volume
+    info.internal_attr = internal_attr
+    info.external_attr = external_attr
+    info._raw_time = raw_time
+    info.extra = extra.encode('latin-1')
+    info.comment = comment.encode('latin-1')
+    return info
+
+
+class IndexedLookup(FastLookup):
+    """
+    FastLookup that loads its members from a sidecar index when
+    one is current, and writes one otherwise.
+    """
+
+    suffix = '.zippidx'
+
+    def _indexable(self):
+        return self.mode == 'r' and isinstance(self.filename, str)
+
+    def _sidecar(self):
+        return self.filename + self.suffix
+
+    def _RealGetContents(self):
+        identity = _identity(self.fp) if self._indexable() else None
+        if identity is None:
+            return super()._RealGetContents()
+        with contextlib.suppress(OSError):
+            with open(self._sidecar(), 'rb') as strm:
+                state = loads(strm.read(), identity)
+            if state is not None:
+                return self._load(state)
+        super()._RealGetContents()
+        self._save(identity)
+
+    def _load(self, state):
+        self.start_dir = state['start_dir']
+        self._comment = state['comment'].encode('latin-1')
+        self.filelist = list(_infos(state['members']))
+        self.NameToInfo = {info.filename: info for info in self.filelist}
+        self._set_end_offsets()
+        self._names_prop = _Names(
+            ((info.filename, info.external_attr) for info in self.filelist),
+            state['implied'],
+            len(self.filelist),
+        )
+
+    def _set_end_offsets(self):
+        """
+        Bound each member by the next, as the stdlib does (where supported)
+        to detect overlapping entries.
+        """
+        if not hasattr(zipfile.ZipInfo, '_end_offset'):  # pragma: no cover
+            return
+        end_offset = self.start_dir
+        for info in sorted(
+            self.filelist, key=lambda info: info.header_offset, reverse=True
+        ):
+            info._end_offset = end_offset
+            end_offset = info.header_offset
+
+    def _save(self, identity):
+        """
+        Write the sidecar atomically, ignoring failure (e.g. a
+        read-only directory). Beyond its owner, the sidecar is
+        readable (and writable) by whoever may read (and write) the
+        archive.
+        """
+        target = self._sidecar()
+        with contextlib.suppress(OSError):
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target) or None)
+            try:
+                with os.fdopen(fd, 'wb') as strm:
+                    strm.write(dumps(self, identity))
+                os.chmod(tmp, os.stat(self.filename).st_mode & 0o066 | 0o600)
+                os.replace(tmp, target)
+            except BaseException:
+                os.remove(tmp)
+                raise